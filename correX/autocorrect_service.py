@@ -5,6 +5,7 @@ import threading
 import time
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional, TYPE_CHECKING, Callable, List, Dict, Any
 
 import keyboard
@@ -150,6 +151,9 @@ class AutoCorrectService:
             executor_to_shutdown = self._executor
             self._executor = None
         
+        # Only a running service owns the overlay window; repeated stop() calls skip this
+        self._mic_overlay.close()
+        
         # Shutdown executor OUTSIDE lock to prevent deadlock
         # (tasks may need to acquire lock during cleanup)
         if executor_to_shutdown is not None:
@@ -194,6 +198,7 @@ class AutoCorrectService:
         ]
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def normalize_trigger_key(raw: Optional[str]) -> Optional[str]:
         """
         Normalize a trigger string into a canonical form understood by the
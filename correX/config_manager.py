@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional, List, Dict, Callable, Tuple
 
 try:
@@ -11,6 +12,25 @@ try:
 except ImportError:  # pragma: no cover - fallback when module unavailable
     GeminiCorrector = None  # type: ignore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional faster JSON codec
+    orjson = None  # type: ignore
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize config to indented UTF-8 JSON, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse config JSON bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 # Configuration validation schema
 CONFIG_SCHEMA: Dict[str, Tuple[type, Callable[[Any], bool], str]] = {
@@ -27,6 +47,23 @@ CONFIG_SCHEMA: Dict[str, Tuple[type, Callable[[Any], bool], str]] = {
 }
 
 
+# Read-only default settings; candidate_settings is filled per call since it
+# comes from GeminiCorrector and is mutable
+_DEFAULT_CONFIG = MappingProxyType({
+    "api_key": "",
+    "model_name": "gemini-2.0-flash-exp",
+    "trigger_key": "ctrl+space",
+    "clear_buffer_trigger_key": "ctrl+shift+delete",
+    "dictation_trigger_key": "ctrl+shift+d",
+    "versions_per_correction": 3,
+    "candidate_settings": None,
+    "paragraph_enabled": True,
+    "start_on_boot": False,
+    "minimize_to_tray": True,
+    "show_notifications": True,
+})
+
+
 def validate_config_value(key: str, value: Any) -> Tuple[bool, str]:
     """Validate a single configuration value.
     
@@ -87,22 +124,36 @@ class ConfigManager:
     - Updates
     """
     
-    def __init__(self, config_file: str = "correx_config.json"):
-        """Initialize config manager."""
-        self.config_dir = Path.home() / ".correx"
-        self.config_dir.mkdir(exist_ok=True)
-        self.config_file = self.config_dir / config_file
+    # File factory used for load/save, called as opener(path, mode) with 'rb'/'wb'.
+    # Tests swap in an in-memory opener; wrap it in staticmethod() when
+    # overriding on the class (see the memfs_config fixture in tests/conftest.py).
+    _file_opener: Callable[..., Any] = staticmethod(open)
+    
+    def __init__(self, config_file: str = "correx_config.json", config_path: Optional[str | Path] = None):
+        """Initialize config manager.
+
+        ``config_path`` overrides the default ``~/.correx/<config_file>`` location
+        (e.g. a pytest ``tmp_path`` file), so callers don't need to patch ``Path.home``.
+        """
+        if config_path is not None:
+            self.config_file = Path(config_path)
+            self.config_dir = self.config_file.parent
+        else:
+            self.config_dir = Path.home() / ".correx"
+            self.config_file = self.config_dir / config_file
+        self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config = self._load_config()
     
     def _load_config(self) -> dict:
         """Load configuration from file."""
         data = None
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            except Exception as e:
-                print(f"[WARNING] Failed to load config: {e}")
+        try:
+            with self._file_opener(self.config_file, 'rb') as f:
+                data = _loads(f.read())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[WARNING] Failed to load config: {e}")
 
         if not isinstance(data, dict):
             data = self._default_config()
@@ -117,19 +168,9 @@ class ConfigManager:
     
     def _default_config(self) -> dict:
         """Return default configuration."""
-        return {
-            "api_key": "",
-            "model_name": "gemini-2.0-flash-exp",
-            "trigger_key": "ctrl+space",
-            "clear_buffer_trigger_key": "ctrl+shift+delete",
-            "dictation_trigger_key": "ctrl+shift+d",
-            "versions_per_correction": 3,
-            "candidate_settings": self._default_candidate_settings(),
-            "paragraph_enabled": True,
-            "start_on_boot": False,
-            "minimize_to_tray": True,
-            "show_notifications": True,
-        }
+        config = dict(_DEFAULT_CONFIG)
+        config["candidate_settings"] = self._default_candidate_settings()
+        return config
 
     def _default_candidate_settings(self) -> List[Dict[str, Any]]:
         if GeminiCorrector and hasattr(GeminiCorrector, "default_candidate_settings"):
@@ -162,8 +203,8 @@ class ConfigManager:
             print("[WARNING] Saving anyway, but some values may be invalid")
         
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
+            with self._file_opener(self.config_file, 'wb') as f:
+                f.write(_dumps(self.config))
             return True
         except Exception as e:
             print(f"[ERROR] Failed to save config: {e}")
@@ -4,19 +4,37 @@ from __future__ import annotations
 import sqlite3
 import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 
 class HistoryManager:
     """Manages correction history with SQLite persistence and auto-cleanup."""
     
-    def __init__(self, db_file: str = "correx_history.db", auto_cleanup: bool = True):
-        """Initialize history manager."""
-        self.db_dir = Path.home() / ".correx"
-        self.db_dir.mkdir(exist_ok=True)
-        self.db_file = self.db_dir / db_file
+    def __init__(
+        self,
+        db_file: str = "correx_history.db",
+        auto_cleanup: bool = True,
+        db_path: Optional[str | Path] = None,
+    ):
+        """Initialize history manager.
+
+        ``db_path`` overrides the default ``~/.correx/<db_file>`` location; pass
+        ``":memory:"`` for a throwaway in-memory database (e.g. in tests).
+        """
+        if db_path is not None:
+            self.db_file = db_path if db_path == ":memory:" else Path(db_path)
+            self.db_dir = None if db_path == ":memory:" else self.db_file.parent
+        else:
+            self.db_dir = Path.home() / ".correx"
+            self.db_file = self.db_dir / db_file
+        if self.db_dir is not None:
+            self.db_dir.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection shared by all calls (guarded by _lock)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         self._init_database()
         
         # Auto-cleanup configuration
@@ -30,7 +48,8 @@ class HistoryManager:
     def _init_database(self) -> None:
         """Initialize database schema."""
         try:
-            with sqlite3.connect(self.db_file, timeout=5) as conn:
+            self._conn = sqlite3.connect(self.db_file, timeout=5, check_same_thread=False)
+            with self._transaction() as conn:
                 cursor = conn.cursor()
 
                 # Improve concurrent access resilience
@@ -74,6 +93,23 @@ class HistoryManager:
 
         except Exception as e:
             print(f"[ERROR] Failed to initialize database: {e}")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection inside a commit-or-rollback transaction."""
+        with self._lock:
+            if self._conn is None:
+                raise sqlite3.ProgrammingError("History database is not open")
+            with self._conn:
+                yield self._conn
+
+    def close(self) -> None:
+        """Stop auto-cleanup and close the database connection."""
+        self.auto_cleanup = False
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
     
     def _start_cleanup_thread(self) -> None:
         """Start background thread for automatic cleanup."""
@@ -97,7 +133,7 @@ class HistoryManager:
     def _cleanup_old_corrections(self) -> int:
         """Remove corrections older than retention period."""
         try:
-            with sqlite3.connect(self.db_file, timeout=5) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
 
                 # Calculate cutoff time
@@ -138,7 +174,7 @@ class HistoryManager:
     ) -> bool:
         """Add a correction to history."""
         try:
-            with sqlite3.connect(self.db_file, timeout=5) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
 
                 # Count words and characters
@@ -170,12 +206,56 @@ class HistoryManager:
             print(f"[ERROR] Failed to add correction to history: {e}")
             return False
     
+    def add_corrections(self, rows: Iterable[Tuple[str, str, Optional[str]]]) -> bool:
+        """Add many corrections at once in a single transaction.
+
+        Each row is ``(original, corrected, application)``; version fields take
+        their defaults. Daily statistics are updated with one upsert.
+        """
+        try:
+            with self._transaction() as conn:
+                records = []
+                total_chars = 0
+                total_words = 0
+                for original, corrected, application in rows:
+                    char_count = len(corrected)
+                    word_count = len(corrected.split())
+                    total_chars += char_count
+                    total_words += word_count
+                    records.append((original, corrected, application, char_count, word_count))
+
+                if not records:
+                    return True
+
+                cursor = conn.cursor()
+
+                cursor.executemany("""
+                    INSERT INTO corrections 
+                    (original_text, corrected_text, application, char_count, word_count)
+                    VALUES (?, ?, ?, ?, ?)
+                """, records)
+
+                cursor.execute("""
+                    INSERT INTO statistics (date, total_corrections, total_characters, total_words)
+                    VALUES (DATE('now'), ?, ?, ?)
+                    ON CONFLICT(date) DO UPDATE SET
+                        total_corrections = total_corrections + ?,
+                        total_characters = total_characters + ?,
+                        total_words = total_words + ?
+                """, (len(records), total_chars, total_words, len(records), total_chars, total_words))
+
+                return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to add corrections to history: {e}")
+            return False
+    
     def get_recent_corrections(self, limit: int = 50) -> List[dict]:
         """Get recent corrections."""
         try:
-            with sqlite3.connect(self.db_file, timeout=5) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._transaction() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
 
                 cursor.execute("""
                     SELECT id, timestamp, original_text, corrected_text, 
@@ -194,7 +274,7 @@ class HistoryManager:
     def get_statistics(self, days: int = 30) -> dict:
         """Get correction statistics for last N days."""
         try:
-            with sqlite3.connect(self.db_file, timeout=5) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
 
                 # Get daily stats
@@ -238,9 +318,9 @@ class HistoryManager:
     def search_corrections(self, query: str, limit: int = 50) -> List[dict]:
         """Search corrections by text content."""
         try:
-            with sqlite3.connect(self.db_file, timeout=5) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._transaction() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
 
                 search_pattern = f"%{query}%"
                 cursor.execute("""
@@ -261,7 +341,7 @@ class HistoryManager:
     def clear_history(self, older_than_days: Optional[int] = None) -> bool:
         """Clear correction history."""
         try:
-            with sqlite3.connect(self.db_file, timeout=5) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
 
                 if older_than_days:
@@ -290,7 +370,7 @@ class HistoryManager:
         try:
             import csv
 
-            with sqlite3.connect(self.db_file, timeout=5) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -314,3 +394,38 @@ class HistoryManager:
         except Exception as e:
             print(f"[ERROR] Failed to export history: {e}")
             return False
+    
+    def backup_to(self, target: str | Path | HistoryManager) -> bool:
+        """Copy the whole database into ``target`` using SQLite's online backup.
+
+        ``target`` is a database path or another ``HistoryManager`` (e.g. a fresh
+        ``":memory:"`` instance seeded from a pre-populated template).
+        """
+        try:
+            if isinstance(target, HistoryManager):
+                # Take both locks in a fixed (id-based) order so two managers backing
+                # up into each other at the same time can't deadlock
+                first, second = sorted((self, target), key=id)
+                with first._lock, second._lock:
+                    if self._conn is None:
+                        raise sqlite3.ProgrammingError("History database is not open")
+                    if target._conn is None:
+                        raise sqlite3.ProgrammingError("Target database is not open")
+                    self._conn.backup(target._conn)
+                return True
+
+            with self._lock:
+                if self._conn is None:
+                    raise sqlite3.ProgrammingError("History database is not open")
+
+                dest = sqlite3.connect(target)
+                try:
+                    self._conn.backup(dest)
+                finally:
+                    dest.close()
+
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to back up history: {e}")
+            return False
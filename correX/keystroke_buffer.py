@@ -3,8 +3,8 @@ from __future__ import annotations
 
 import threading
 import time
-from typing import Optional, Dict
-from collections import deque
+from typing import Optional, Deque, Dict
+from collections import OrderedDict, deque
 
 try:
     import win32gui
@@ -27,11 +27,14 @@ class KeystrokeBuffer:
         Args:
             max_buffer_size: Maximum characters to store per window
         """
-        self.max_buffer_size = max_buffer_size
         self._lock = threading.RLock()
+        self._max_buffer_size = max_buffer_size
         
-        # Per-window buffers: {window_handle: text_buffer}
-        self._buffers: Dict[int, str] = {}
+        # Per-window buffers: {window_handle: bounded deque of characters},
+        # ordered least- to most-recently used for LRU cleanup
+        self._buffers: OrderedDict[int, Deque[str]] = OrderedDict()
+        # Joined text per window, dropped whenever that window's buffer changes
+        self._text_cache: Dict[int, str] = {}
         
         # Track current window
         self._current_window = None
@@ -66,6 +69,38 @@ class KeystrokeBuffer:
             'esc', 'delete',
         }
     
+    @property
+    def max_buffer_size(self) -> int:
+        """Maximum characters stored per window."""
+        return self._max_buffer_size
+    
+    @max_buffer_size.setter
+    def max_buffer_size(self, value: int) -> None:
+        # deque maxlen is fixed at creation, so rebuild buffers to keep the cap enforced in C
+        with self._lock:
+            self._max_buffer_size = value
+            for window_handle, buffer in self._buffers.items():
+                if buffer.maxlen != value:
+                    self._buffers[window_handle] = deque(buffer, maxlen=value)
+                    self._text_cache.pop(window_handle, None)
+    
+    def _resolve_window(self, window_handle: Optional[int]) -> Optional[int]:
+        """Return the target window as a plain int key (None = current window)."""
+        if window_handle is None:
+            self._update_current_window()
+            return self._current_window
+        # HWNDs are keyed as int so every lookup uses cheap int hashing
+        return int(window_handle)
+    
+    def _get_or_create(self, window_handle: int) -> Deque[str]:
+        """Return the buffer for a window, creating an empty one if needed."""
+        buffer = self._buffers.get(window_handle)
+        if buffer is None:
+            # maxlen makes the deque drop the oldest characters on overflow
+            buffer = deque(maxlen=self.max_buffer_size)
+            self._buffers[window_handle] = buffer
+        return buffer
+    
     def _get_foreground_window(self) -> Optional[int]:
         """Get current foreground window handle."""
         if win32gui is None:
@@ -73,7 +108,7 @@ class KeystrokeBuffer:
         
         try:
             hwnd = win32gui.GetForegroundWindow()
-            return hwnd if hwnd else None
+            return int(hwnd) if hwnd else None
         except Exception:
             # Win32 API call failed
             return None
@@ -91,6 +126,9 @@ class KeystrokeBuffer:
         
         if new_window != self._current_window:
             self._current_window = new_window
+            # Recency only changes on focus change, so keystrokes need a single lookup
+            if new_window in self._buffers:
+                self._buffers.move_to_end(new_window)
             print(f"[BUFFER] Focus changed to window: {new_window}")
             
             # Trigger cleanup periodically
@@ -117,17 +155,12 @@ class KeystrokeBuffer:
             if self._current_window is None:
                 return
             
-            # Initialize buffer for this window if needed
-            if self._current_window not in self._buffers:
-                self._buffers[self._current_window] = ""
-            
-            buffer = self._buffers[self._current_window]
-            
-            # Handle backspace
+            # Handle backspace: O(1) pop, and no buffer is created just to stay empty
             if is_backspace or key_name == 'backspace':
-                if len(buffer) > 0:
-                    buffer = buffer[:-1]
-                    self._buffers[self._current_window] = buffer
+                buffer = self._buffers.get(self._current_window)
+                if buffer:
+                    buffer.pop()
+                    self._text_cache.pop(self._current_window, None)
                 return
             
             # Ignore special keys
@@ -144,14 +177,9 @@ class KeystrokeBuffer:
                 # Unknown key, ignore
                 return
             
-            # Add to buffer
-            buffer += char
-            
-            # Trim if too long
-            if len(buffer) > self.max_buffer_size:
-                buffer = buffer[-self.max_buffer_size:]
-            
-            self._buffers[self._current_window] = buffer
+            # Add to buffer (deque trims to max_buffer_size itself)
+            self._get_or_create(self._current_window).append(char)
+            self._text_cache.pop(self._current_window, None)
     
     def get_buffer(self, window_handle: Optional[int] = None) -> str:
         """
@@ -164,14 +192,17 @@ class KeystrokeBuffer:
             Current buffer content as string
         """
         with self._lock:
-            if window_handle is None:
-                self._update_current_window()
-                window_handle = self._current_window
-            
+            window_handle = self._resolve_window(window_handle)
             if window_handle is None:
                 return ""
             
-            return self._buffers.get(window_handle, "")
+            text = self._text_cache.get(window_handle)
+            if text is None:
+                buffer = self._buffers.get(window_handle)
+                if not buffer:
+                    return ""
+                text = self._text_cache[window_handle] = "".join(buffer)
+            return text
     
     def set_buffer(self, text: str, window_handle: Optional[int] = None) -> None:
         """
@@ -182,14 +213,15 @@ class KeystrokeBuffer:
             window_handle: Specific window to set buffer for (None = current window)
         """
         with self._lock:
-            if window_handle is None:
-                self._update_current_window()
-                window_handle = self._current_window
-            
+            window_handle = self._resolve_window(window_handle)
             if window_handle is None:
                 return
             
-            self._buffers[window_handle] = text
+            # Only the tail that fits survives, so skip feeding the rest through the deque
+            tail = text[-self.max_buffer_size:]
+            self._buffers[window_handle] = deque(tail, maxlen=self.max_buffer_size)
+            self._buffers.move_to_end(window_handle)
+            self._text_cache.pop(window_handle, None)
     
     def clear_buffer(self, window_handle: Optional[int] = None) -> None:
         """
@@ -199,15 +231,20 @@ class KeystrokeBuffer:
             window_handle: Specific window to clear (None = current window)
         """
         with self._lock:
-            if window_handle is None:
-                self._update_current_window()
-                window_handle = self._current_window
-            
+            window_handle = self._resolve_window(window_handle)
             if window_handle is None:
                 return
             
-            if window_handle in self._buffers:
-                self._buffers[window_handle] = ""
+            buffer = self._buffers.get(window_handle)
+            if buffer is not None:
+                buffer.clear()
+                self._text_cache.pop(window_handle, None)
+    
+    def clear_all_buffers(self) -> None:
+        """Drop the buffers of every window, reusing the existing container."""
+        with self._lock:
+            self._buffers.clear()
+            self._text_cache.clear()
     
     def add_text(self, text: str, window_handle: Optional[int] = None) -> None:
         """
@@ -218,25 +255,14 @@ class KeystrokeBuffer:
             window_handle: Specific window to add to (None = current window)
         """
         with self._lock:
-            if window_handle is None:
-                self._update_current_window()
-                window_handle = self._current_window
-            
+            window_handle = self._resolve_window(window_handle)
             if window_handle is None:
                 return
             
-            # Initialize buffer if needed
-            if window_handle not in self._buffers:
-                self._buffers[window_handle] = ""
-            
-            # Add text to buffer
-            buffer = self._buffers[window_handle] + text
-            
-            # Trim if too long
-            if len(buffer) > self.max_buffer_size:
-                buffer = buffer[-self.max_buffer_size:]
-            
-            self._buffers[window_handle] = buffer
+            # Add the text in one bulk extend, pre-sliced to what can fit
+            self._get_or_create(window_handle).extend(text[-self.max_buffer_size:])
+            self._buffers.move_to_end(window_handle)
+            self._text_cache.pop(window_handle, None)
     
     def reset_on_cursor_move(self) -> None:
         """
@@ -261,17 +287,16 @@ class KeystrokeBuffer:
             if len(self._buffers) <= max_windows:
                 return
             
-            # Keep current window and most recent ones
-            windows_to_keep = [self._current_window] if self._current_window else []
-            other_windows = [w for w in self._buffers.keys() if w != self._current_window]
-            
-            # Keep most recent
-            windows_to_keep.extend(other_windows[-(max_windows-1):])
+            # Always keep the current window
+            if self._current_window in self._buffers:
+                self._buffers.move_to_end(self._current_window)
             
-            # Remove old buffers
-            old_count = len(self._buffers)
-            self._buffers = {w: self._buffers[w] for w in windows_to_keep if w in self._buffers}
-            removed = old_count - len(self._buffers)
+            # Evict least recently used buffers, O(1) each
+            removed = 0
+            while len(self._buffers) > max(max_windows, 1):
+                evicted, _ = self._buffers.popitem(last=False)
+                self._text_cache.pop(evicted, None)
+                removed += 1
             
             if removed > 0:
                 print(f"[BUFFER] Cleaned up {removed} old window buffers (keeping {len(self._buffers)})")
@@ -5,6 +5,7 @@ import argparse
 import logging
 import os
 import threading
+import traceback
 from pathlib import Path
 from typing import Optional
 
@@ -13,7 +14,7 @@ if __package__:
     from .gemini_corrector import GeminiCorrector
     from .gui.app_gui import launch_app, focus_existing_window
     from .asset_manager import get_asset_manager
-    from .logger import CorreXLogger
+    from .logger import CorreXLogger, get_logger
 
     try:
         from .config_manager import ConfigManager
@@ -36,7 +37,7 @@ else:
     from correX.gemini_corrector import GeminiCorrector  # type: ignore[import-not-found]
     from correX.gui.app_gui import launch_app, focus_existing_window  # type: ignore[import-not-found]
     from correX.asset_manager import get_asset_manager  # type: ignore[import-not-found]
-    from correX.logger import CorreXLogger  # type: ignore[import-not-found]
+    from correX.logger import CorreXLogger, get_logger  # type: ignore[import-not-found]
 
     try:
         from correX.config_manager import ConfigManager  # type: ignore[import-not-found]
@@ -49,16 +50,33 @@ else:
         TrayIcon = None
 
 
+# Default hotkeys are already in canonical form, so they bypass normalization
+_DEFAULT_TRIGGER = "ctrl+space"
+_DEFAULT_CLEAR = "ctrl+shift+delete"
+_DEFAULT_DICTATION = "ctrl+shift+d"
+
+
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once and reuse it on later calls."""
+    global _PARSER
+    if _PARSER is None:
+        parser = argparse.ArgumentParser(description="CorreX - AI-Powered Text Correction with Gemini")
+        parser.add_argument("--api-key", type=str, default=None, help="Gemini API key (or set GEMINI_API_KEY env var)")
+        parser.add_argument("--model", type=str, default="gemini-2.0-flash-exp", help="Gemini model to use")
+        parser.add_argument("--no-gui", action="store_true", help="Run the background service without launching the configuration window")
+        parser.add_argument("--show-gui", action="store_true", help="Open the configuration window immediately on startup")
+        parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose debug output")
+        parser.add_argument("-q", "--quiet", action="store_true", help="Suppress all console output except errors")
+        parser.add_argument("--log-file", type=str, default=None, help="Write logs to specified file")
+        _PARSER = parser
+    return _PARSER
+
+
 def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="CorreX - AI-Powered Text Correction with Gemini")
-    parser.add_argument("--api-key", type=str, default=None, help="Gemini API key (or set GEMINI_API_KEY env var)")
-    parser.add_argument("--model", type=str, default="gemini-2.0-flash-exp", help="Gemini model to use")
-    parser.add_argument("--no-gui", action="store_true", help="Run the background service without launching the configuration window")
-    parser.add_argument("--show-gui", action="store_true", help="Open the configuration window immediately on startup")
-    parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose debug output")
-    parser.add_argument("-q", "--quiet", action="store_true", help="Suppress all console output except errors")
-    parser.add_argument("--log-file", type=str, default=None, help="Write logs to specified file")
-    return parser.parse_args()
+    return _get_parser().parse_args()
 
 
 def main() -> None:
@@ -73,30 +91,32 @@ def main() -> None:
         CorreXLogger.setup(
             level=log_level,
             log_file=log_file,
-            console=not args.quiet
+            # --quiet still shows errors: the console handler follows log_level (ERROR)
+            console=True
         )
+        log = get_logger("main")
 
-        print(f"[INFO] Starting CorreX with Google Gemini API")
-        print(f"[INFO] Default Model: {args.model}")
+        log.info("Starting CorreX with Google Gemini API")
+        log.info("Default Model: %s", args.model)
         if args.verbose:
-            print(f"[INFO] Logging level: DEBUG")
+            log.info("Logging level: DEBUG")
         if log_file:
-            print(f"[INFO] Writing logs to: {log_file}")
+            log.info("Writing logs to: %s", log_file)
 
         # Initialize config manager
         config = ConfigManager() if ConfigManager else None
         minimize_to_tray = True
         if config:
-            print(f"[INFO] Configuration loaded from: {config.config_file}")
+            log.info("Configuration loaded from: %s", config.config_file)
             try:
                 minimize_to_tray = config.should_minimize_to_tray()
             except Exception as config_error:
-                print(f"[WARNING] Failed to read 'minimize_to_tray' from config: {config_error}")
+                log.warning("Failed to read 'minimize_to_tray' from config: %s", config_error)
         
         # Initialize history manager
         history = HistoryManager() if HistoryManager else None
         if history:
-            print(f"[INFO] History database: {history.db_file}")
+            log.info("History database: %s", history.db_file)
 
         # Try to initialize Gemini corrector
         corrector = None
@@ -105,31 +125,31 @@ def main() -> None:
         
         if api_key:
             try:
-                print(f"[INFO] API key found - initializing Gemini...")
+                log.info("API key found - initializing Gemini...")
                 corrector = GeminiCorrector(api_key=api_key, model_name=model_name)
-                print(f"[INFO] ✓ Gemini initialized successfully")
+                log.info("✓ Gemini initialized successfully")
             except Exception as e:
-                print(f"[WARNING] Failed to initialize Gemini: {e}")
-                print(f"[INFO] You can set the API key in the GUI")
+                log.warning("Failed to initialize Gemini: %s", e)
+                log.info("You can set the API key in the GUI")
                 corrector = None
         else:
-            print(f"[INFO] No API key found - please configure in GUI")
-            print(f"[INFO] Get your key: https://makersuite.google.com/app/apikey")
+            log.info("No API key found - please configure in GUI")
+            log.info("Get your key: https://makersuite.google.com/app/apikey")
 
         # Create with dummy key if none exists (allows GUI to launch)
         if corrector is None:
             try:
                 corrector = GeminiCorrector(api_key="dummy-key-replace-in-gui", model_name=model_name, allow_dummy=True)
-                print(f"[INFO] Using placeholder - configure API key in GUI to activate")
+                log.info("Using placeholder - configure API key in GUI to activate")
             except Exception as e:
-                print(f"[ERROR] Failed to create placeholder corrector: {e}")
-                print(f"[ERROR] Cannot proceed without corrector object")
+                log.error("Failed to create placeholder corrector: %s", e)
+                log.error("Cannot proceed without corrector object")
                 return
 
         # Trigger-based autocorrect service with instant buffer replacement
-        print(f"[INFO] Initializing trigger-based autocorrect service...")
+        log.info("Initializing trigger-based autocorrect service...")
         try:
-            trigger_key = AutoCorrectService.normalize_trigger_key("ctrl+space") or "ctrl+space"
+            trigger_key = _DEFAULT_TRIGGER
             if config:
                 configured_trigger = config.get_trigger_key()
                 if isinstance(configured_trigger, str):
@@ -137,7 +157,7 @@ def main() -> None:
                     if normalized_trigger:
                         trigger_key = normalized_trigger
 
-            clear_trigger = AutoCorrectService.normalize_trigger_key("ctrl+shift+delete") or "ctrl+shift+delete"
+            clear_trigger = _DEFAULT_CLEAR
             if config:
                 configured_clear = config.get_clear_buffer_trigger_key()
                 if isinstance(configured_clear, str):
@@ -146,12 +166,12 @@ def main() -> None:
                         clear_trigger = ""
                     elif normalized_clear:
                         if normalized_clear == trigger_key:
-                            print(f"[WARNING] Clear-buffer trigger '{normalized_clear}' matches correction trigger; disabling clear trigger")
+                            log.warning("Clear-buffer trigger '%s' matches correction trigger; disabling clear trigger", normalized_clear)
                             clear_trigger = ""
                         else:
                             clear_trigger = normalized_clear
                     elif configured_clear.strip():
-                        print(f"[WARNING] Invalid clear-buffer trigger in config: {configured_clear} - defaulting to CTRL+SHIFT+DELETE")
+                        log.warning("Invalid clear-buffer trigger in config: %s - defaulting to CTRL+SHIFT+DELETE", configured_clear)
 
             versions = 3
             if config:
@@ -164,19 +184,19 @@ def main() -> None:
                 try:
                     candidate_settings = config.get_candidate_settings()
                 except Exception as candidate_error:
-                    print(f"[WARNING] Failed to load candidate personalization: {candidate_error}")
+                    log.warning("Failed to load candidate personalization: %s", candidate_error)
                     candidate_settings = GeminiCorrector.default_candidate_settings()
 
-            dictation_trigger = AutoCorrectService.normalize_trigger_key("ctrl+shift+d") or "ctrl+shift+d"
+            dictation_trigger = _DEFAULT_DICTATION
             if config:
-                configured_dictation = config.get("dictation_trigger_key", "ctrl+shift+d")
+                configured_dictation = config.get("dictation_trigger_key", _DEFAULT_DICTATION)
                 if isinstance(configured_dictation, str) and configured_dictation.strip():
                     normalized_dictation = AutoCorrectService.normalize_trigger_key(configured_dictation)
                     if normalized_dictation:
                         if normalized_dictation != trigger_key and normalized_dictation != clear_trigger:
                             dictation_trigger = normalized_dictation
                         else:
-                            print(f"[WARNING] Dictation trigger conflicts with other triggers - using default")
+                            log.warning("Dictation trigger conflicts with other triggers - using default")
 
             enabled = config.is_paragraph_enabled() if config else True
             if enabled is None:
@@ -194,8 +214,7 @@ def main() -> None:
             )
             service.start()
         except Exception as e:
-            print(f"[ERROR] Failed to start autocorrect service: {e}")
-            import traceback
+            log.error("Failed to start autocorrect service: %s", e)
             traceback.print_exc()
             return
 
@@ -215,12 +234,12 @@ def main() -> None:
             try:
                 service.stop()
             except Exception as stop_error:
-                print(f"[WARNING] Failed to stop service cleanly: {stop_error}")
+                log.warning("Failed to stop service cleanly: %s", stop_error)
             if tray_icon:
                 try:
                     tray_icon.stop()
                 except Exception as tray_error:
-                    print(f"[WARNING] Failed to stop tray icon: {tray_error}")
+                    log.warning("Failed to stop tray icon: %s", tray_error)
             exit_event.set()
 
         def handle_toggle(enabled: bool) -> None:
@@ -228,17 +247,17 @@ def main() -> None:
             if config:
                 config.set_paragraph_enabled(enabled)
             state = "enabled" if enabled else "paused"
-            print(f"[CONFIG] Auto-correct {state}")
+            log.info("Auto-correct %s", state)
 
         def handle_exit() -> None:
-            print("[INFO] Exiting CorreX")
+            log.info("Exiting CorreX")
             shutdown_service()
 
         def handle_show_gui() -> None:
             if focus_existing_window():
                 return
             if gui_active.is_set():
-                print("[INFO] Settings window is already open")
+                log.info("Settings window is already open")
                 return
 
             gui_active.set()
@@ -254,8 +273,7 @@ def main() -> None:
                         on_close=gui_active.clear,
                     )
                 except Exception as gui_error:
-                    print(f"[ERROR] GUI error: {gui_error}")
-                    import traceback
+                    log.error("GUI error: %s", gui_error)
                     traceback.print_exc()
                 finally:
                     gui_active.clear()
@@ -267,16 +285,16 @@ def main() -> None:
         try:
             if args.no_gui:
                 if hasattr(corrector, 'is_configured') and corrector.is_configured:
-                    print("[INFO] CorreX running in background. Press Ctrl+C to exit.")
-                    _block_forever()
+                    log.info("CorreX running in background. Press Ctrl+C to exit.")
+                    _block_forever(exit_event)
                 else:
-                    print("[ERROR] Cannot run without GUI - API key not configured!")
-                    print("[ERROR] Please set GEMINI_API_KEY or run with GUI to configure")
+                    log.error("Cannot run without GUI - API key not configured!")
+                    log.error("Please set GEMINI_API_KEY or run with GUI to configure")
                     shutdown_service()
                     return
             else:
                 if TrayIcon is not None:
-                    # Use asset manager to get logo path
+                    # Only the tray path needs assets; --no-gui never touches them
                     asset_manager = get_asset_manager()
                     logo_path = asset_manager.get_icon_path("CorreX_logo.png")
                     tray_icon = TrayIcon(
@@ -288,7 +306,7 @@ def main() -> None:
                         initial_enabled=enabled,
                     )
                     tray_icon.start()
-                    print("[INFO] CorreX is running in the system tray.")
+                    log.info("CorreX is running in the system tray.")
                     notify_flag = Path.home() / ".correx" / "tray_tip.flag"
                     try:
                         notify_flag.parent.mkdir(parents=True, exist_ok=True)
@@ -299,7 +317,7 @@ def main() -> None:
                             )
                             notify_flag.write_text("shown", encoding="utf-8")
                     except Exception as notify_error:
-                        print(f"[WARNING] Failed to show tray notification: {notify_error}")
+                        log.warning("Failed to show tray notification: %s", notify_error)
                     should_show_gui = args.show_gui
                     if not getattr(corrector, 'is_configured', False):
                         should_show_gui = True
@@ -309,32 +327,27 @@ def main() -> None:
                         handle_show_gui()
                     exit_event.wait()
                 else:
-                    print("[WARNING] pystray is not available - launching configuration window")
+                    log.warning("pystray is not available - launching configuration window")
                     launch_app(service=service, corrector=corrector, config=config, history=history)
                     shutdown_service()
         except KeyboardInterrupt:
-            print("\n[INFO] Keyboard interrupt detected")
+            log.info("Keyboard interrupt detected")
             shutdown_service()
         except Exception as e:
-            print(f"\n[ERROR] Application error: {e}")
-            import traceback
+            log.error("Application error: %s", e)
             traceback.print_exc()
             shutdown_service()
         finally:
             shutdown_service()
     except Exception as e:
         print(f"\n[FATAL] Unhandled error in main: {e}")
-        import traceback
         traceback.print_exc()
 
 
-def _block_forever() -> None:
-    stop = threading.Event()
-    while True:
-        try:
-            stop.wait(timeout=3600)
-        except KeyboardInterrupt:
-            raise
+def _block_forever(stop: threading.Event) -> None:
+    """Block until ``stop`` is set; Ctrl+C propagates as KeyboardInterrupt."""
+    while not stop.wait():
+        pass
 
 
 if __name__ == "__main__":
@@ -33,13 +33,37 @@ class MicOverlay:
         self._mic_path = None
         self._asset_manager = get_asset_manager()
         self._root: Optional[tk.Misc] = None
+        self._target_root_cache: Optional[tk.Misc] = None
         self._container: Optional[tk.Frame] = None
         self._icon_label: Optional[tk.Label] = None
         self._text_label: Optional[tk.Label] = None
+        self._screen_size: Optional[tuple[int, int]] = None
         
     def attach_root(self, root: tk.Misc) -> None:
         """Attach the overlay to an existing Tk root for thread-safe updates."""
         self._root = root
+        self._target_root_cache = None
+        self._watch_root(root)
+
+    def _watch_root(self, root: tk.Misc) -> None:
+        """Forget root once it is destroyed.
+
+        after() is a core Tcl command, so it keeps "succeeding" on a destroyed
+        root whose mainloop is gone and the callback silently never runs.
+        """
+        def on_destroy(event) -> None:
+            # Children's <Destroy> events also reach the root's binding
+            if event.widget is not root:
+                return
+            if self._root is root:
+                self._root = None
+            if self._target_root_cache is root:
+                self._target_root_cache = None
+
+        try:
+            root.bind("<Destroy>", on_destroy, add="+")
+        except tk.TclError:
+            pass
 
     def show(self) -> None:
         """Show the microphone overlay."""
@@ -49,20 +73,29 @@ class MicOverlay:
         """Hide the microphone overlay."""
         self._run_on_ui_thread(self._hide_internal)
 
+    def close(self) -> None:
+        """Destroy the overlay window (call on process shutdown)."""
+        self._run_on_ui_thread(self._close_internal)
+
     def _run_on_ui_thread(self, callback) -> None:
         """Ensure the provided callback runs on an active Tk UI thread."""
-        target_root = None
-        try:
-            if self._root and self._root.winfo_exists():
-                target_root = self._root
-            elif tk._default_root is not None and tk._default_root.winfo_exists():  # type: ignore[attr-defined]
-                target_root = tk._default_root  # type: ignore[attr-defined]
-        except tk.TclError:
-            target_root = None
+        # The cached root is dropped by its <Destroy> binding (see _watch_root);
+        # TclError still covers an interpreter that is gone entirely.
+        target_root = self._target_root_cache
+        if target_root is not None:
+            try:
+                target_root.after(0, callback)
+                return
+            except tk.TclError:
+                self._target_root_cache = None
 
+        target_root = self._root or tk._default_root  # type: ignore[attr-defined]
         if target_root is not None:
             try:
                 target_root.after(0, callback)
+                if target_root is not self._root:
+                    self._watch_root(target_root)
+                self._target_root_cache = target_root
                 return
             except tk.TclError:
                 pass
@@ -70,9 +103,36 @@ class MicOverlay:
         # Fall back to direct call if scheduling is not possible
         callback()
 
+    def _window_alive(self) -> bool:
+        """Return True if the overlay window still exists; forget it otherwise.
+
+        A withdrawn window is kept for reuse, so its parent root may have been
+        destroyed meanwhile, and then winfo_exists() itself raises TclError.
+        """
+        if not self.window:
+            return False
+        try:
+            if self.window.winfo_exists():
+                return True
+        except tk.TclError:
+            pass
+        self._forget_window()
+        return False
+
+    def _forget_window(self) -> None:
+        """Drop references to the (destroyed) overlay window and its widgets."""
+        self.window = None
+        self.is_visible = False
+        self._animation_id = None
+        self._container = None
+        self._icon_label = None
+        self._text_label = None
+        # PhotoImages belong to the Tk interpreter, which may be gone too
+        self._mic_icon = None
+
     def _show_internal(self) -> None:
         """Internal implementation that builds and shows the overlay."""
-        if self.is_visible and self.window and self.window.winfo_exists():
+        if self.is_visible and self._window_alive():
             return
 
         self._ensure_window()
@@ -89,30 +149,41 @@ class MicOverlay:
             pass
 
     def _hide_internal(self) -> None:
-        """Internal implementation that hides and cleans up the overlay."""
+        """Internal implementation that withdraws the overlay, keeping widgets for reuse."""
         if not self.is_visible:
             return
 
         self.is_visible = False
+        self._cancel_animation()
 
-        if self._animation_id and self.window:
+        if self._window_alive():
             try:
-                self.window.after_cancel(self._animation_id)
+                self.window.withdraw()
             except tk.TclError:
                 pass
-            self._animation_id = None
+        print("[MIC_OVERLAY] Hidden")
 
-        if self.window and self.window.winfo_exists():
+    def _close_internal(self) -> None:
+        """Internal implementation that destroys the overlay window and its widgets."""
+        self.is_visible = False
+        self._cancel_animation()
+
+        if self._window_alive():
             try:
                 self.window.destroy()
             except tk.TclError:
                 pass
 
-        self.window = None
-        self._container = None
-        self._icon_label = None
-        self._text_label = None
-        print("[MIC_OVERLAY] Hidden")
+        self._forget_window()
+
+    def _cancel_animation(self) -> None:
+        """Stop the pending pulse animation callback, if any."""
+        if self._animation_id and self.window:
+            try:
+                self.window.after_cancel(self._animation_id)
+            except tk.TclError:
+                pass
+        self._animation_id = None
 
     def _ensure_window(self) -> None:
         """Create the overlay window if it does not exist."""
@@ -123,7 +194,7 @@ class MicOverlay:
         except tk.TclError:
             parent = None
 
-        if self.window and self.window.winfo_exists():
+        if self._window_alive():
             return
 
         try:
@@ -132,6 +203,15 @@ class MicOverlay:
             self.window = None
             return
 
+        window = self.window
+
+        def on_destroy(event) -> None:
+            # Also fires when the parent root is destroyed; ignore child widgets
+            if event.widget is window and self.window is window:
+                self._forget_window()
+
+        window.bind("<Destroy>", on_destroy, add="+")
+
         self.window.title("Dictation Active")
         self.window.overrideredirect(True)  # Remove window decorations
         try:
@@ -142,8 +222,9 @@ class MicOverlay:
 
         width = 200
         height = 130
-        screen_width = self.window.winfo_screenwidth()
-        screen_height = self.window.winfo_screenheight()
+        if self._screen_size is None:
+            self._screen_size = (self.window.winfo_screenwidth(), self.window.winfo_screenheight())
+        screen_width, screen_height = self._screen_size
         x = (screen_width - width) // 2
         y = screen_height - height - 100  # 100px from bottom
         self.window.geometry(f"{width}x{height}+{x}+{y}")
@@ -1,11 +1,27 @@
 """Cross-application text buffer manipulation using Windows APIs."""
 from __future__ import annotations
 
+import ctypes
+import logging
+import random
+import threading
 import time
-from typing import Optional, Tuple
-
-MAX_CLIPBOARD_RETRIES = 5
-CLIPBOARD_RETRY_DELAY = 0.05
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from ctypes import wintypes
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# Child of the "CorreX" logger configured by CorreXLogger.setup()
+logger = logging.getLogger("CorreX.text_buffer")
+
+MAX_CLIPBOARD_RETRIES = 8
+CLIPBOARD_BASE_DELAY = 0.005
+CLIPBOARD_MAX_DELAY = 0.2
+CLIPBOARD_JITTER = 0.01
+UIA_CACHE_REUSE_SECONDS = 2.0
+UIA_CACHE_EXPIRE_SECONDS = 5.0
+UIA_CACHE_MAX_ENTRIES = 8
+FALLBACK_PROBE_TIMEOUT = 0.12
 
 try:
     import win32gui
@@ -13,6 +29,7 @@ try:
     import win32api
     import win32clipboard
     from pywinauto import Desktop
+    from pywinauto.application import Application as _PywinautoApplication
     from pywinauto.controls.win32_controls import EditWrapper
     from pywinauto.controls.uiawrapper import UIAWrapper
 except ImportError:
@@ -21,11 +38,169 @@ except ImportError:
     win32api = None  # type: ignore[assignment]
     win32clipboard = None  # type: ignore[assignment]
     Desktop = None  # type: ignore[assignment]
+    _PywinautoApplication = None  # type: ignore[assignment]
     EditWrapper = None  # type: ignore[assignment]
     UIAWrapper = None  # type: ignore[assignment]
     print("[ERROR] pywin32 not installed. Run: pip install pywin32 pywinauto")
 
 
+# Common window-title shapes returned by WM_GETTEXT instead of control content
+_TITLE_SUFFIXES = (" - Notepad", " - Word", " - Chrome", " - Firefox", " - Microsoft")
+_TITLE_TOKENS = ("Untitled",)
+
+# Private handle so the argtypes we set don't leak into pywinauto's shared ctypes.windll.user32
+_user32 = ctypes.WinDLL("user32") if hasattr(ctypes, "WinDLL") else None
+_kernel32 = ctypes.WinDLL("kernel32") if hasattr(ctypes, "WinDLL") else None
+
+GMEM_MOVEABLE = 0x0002
+
+# Win32 ABI constants, snapshotted as plain ints so hot paths skip win32con attribute lookups
+_VK_CONTROL = 0x11
+_WM_SETTEXT = 0x000C
+_WM_GETTEXT = 0x000D
+_WM_GETTEXTLENGTH = 0x000E
+_CF_UNICODETEXT = 13
+_KEYEVENTF_KEYUP = 0x0002
+_SMTO_ABORTIFHUNG = 0x0002
+# WM_GETTEXTLENGTH goes to another process; never wait on it longer than this
+_TEXT_LENGTH_TIMEOUT_MS = 50
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_SCANCODE = 0x0008
+MAPVK_VK_TO_VSC = 0
+_ULONG_PTR = ctypes.c_size_t
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", _ULONG_PTR),
+    ]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", _ULONG_PTR),
+    ]
+
+
+class _HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT), ("hi", _HARDWAREINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    """Mirror of winuser.h INPUT, used to post key chords atomically via SendInput."""
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+
+class _GUITHREADINFO(ctypes.Structure):
+    """Mirror of winuser.h GUITHREADINFO; reports another thread's focused control."""
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("flags", wintypes.DWORD),
+        ("hwndActive", wintypes.HWND),
+        ("hwndFocus", wintypes.HWND),
+        ("hwndCapture", wintypes.HWND),
+        ("hwndMenuOwner", wintypes.HWND),
+        ("hwndMoveSize", wintypes.HWND),
+        ("hwndCaret", wintypes.HWND),
+        ("rcCaret", wintypes.RECT),
+    ]
+
+
+if _user32 is not None:
+    _user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int)
+    _user32.SendInput.restype = wintypes.UINT
+    _user32.GetClipboardSequenceNumber.restype = wintypes.DWORD
+    _user32.SendMessageW.argtypes = (wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+    _user32.SendMessageW.restype = wintypes.LPARAM
+    _user32.GetWindowThreadProcessId.argtypes = (wintypes.HWND, ctypes.POINTER(wintypes.DWORD))
+    _user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    _user32.GetGUIThreadInfo.argtypes = (wintypes.DWORD, ctypes.POINTER(_GUITHREADINFO))
+    _user32.GetGUIThreadInfo.restype = wintypes.BOOL
+    _user32.SendMessageTimeoutW.argtypes = (
+        wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM,
+        wintypes.UINT, wintypes.UINT, ctypes.POINTER(_ULONG_PTR),
+    )
+    _user32.SendMessageTimeoutW.restype = wintypes.LPARAM
+    _user32.MapVirtualKeyExW.argtypes = (wintypes.UINT, wintypes.UINT, wintypes.HKL)
+    _user32.MapVirtualKeyExW.restype = wintypes.UINT
+    _user32.GetForegroundWindow.restype = wintypes.HWND
+    _user32.GetKeyboardLayout.argtypes = (wintypes.DWORD,)
+    _user32.GetKeyboardLayout.restype = wintypes.HKL
+
+if _kernel32 is not None:
+    _kernel32.GlobalAlloc.argtypes = (wintypes.UINT, ctypes.c_size_t)
+    _kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    _kernel32.GlobalLock.argtypes = (wintypes.HGLOBAL,)
+    _kernel32.GlobalLock.restype = ctypes.c_void_p
+    _kernel32.GlobalUnlock.argtypes = (wintypes.HGLOBAL,)
+    _kernel32.GlobalUnlock.restype = wintypes.BOOL
+    _kernel32.GlobalFree.argtypes = (wintypes.HGLOBAL,)
+    _kernel32.GlobalFree.restype = wintypes.HGLOBAL
+
+
+def _alloc_unicode_handle(text: str) -> Optional[int]:
+    """Copy text into a movable global memory block ready for SetClipboardData.
+
+    Done before OpenClipboard so the clipboard lock is only held for the
+    handle hand-off, not for encoding and copying the text.
+    """
+    if _kernel32 is None:
+        return None
+    source = ctypes.create_unicode_buffer(text)
+    size = ctypes.sizeof(source)
+    handle = _kernel32.GlobalAlloc(GMEM_MOVEABLE, size)
+    if not handle:
+        return None
+    locked = _kernel32.GlobalLock(handle)
+    if not locked:
+        _kernel32.GlobalFree(handle)
+        return None
+    try:
+        ctypes.memmove(locked, source, size)
+    finally:
+        _kernel32.GlobalUnlock(handle)
+    return handle
+
+
+def _free_unicode_handle(handle: Optional[int]) -> None:
+    """Release a handle from _alloc_unicode_handle that the clipboard never took."""
+    if handle and _kernel32 is not None:
+        _kernel32.GlobalFree(handle)
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float, granularity: float = 0.002) -> bool:
+    """Poll predicate until it holds or timeout elapses; returns the final result."""
+    deadline = time.perf_counter() + timeout
+    while True:
+        if predicate():
+            return True
+        if time.perf_counter() >= deadline:
+            return False
+        time.sleep(granularity)
+
+
+def _clipboard_backoff(attempt: int) -> float:
+    """Exponential backoff with jitter so we don't collide with another clipboard holder."""
+    return min(CLIPBOARD_BASE_DELAY * (1 << attempt), CLIPBOARD_MAX_DELAY) + random.random() * CLIPBOARD_JITTER
+
 class TextBufferManager:
     """Manages direct text buffer access across different Windows applications."""
 
@@ -33,6 +208,17 @@ class TextBufferManager:
         """Initialize the text buffer manager."""
         self._last_hwnd = None
         self._last_text = ""
+        # Last clipboard text we read or wrote, keyed by the clipboard sequence number
+        self._cached_seq = 0
+        self._cached_text: Optional[str] = None
+        # hwnd -> (connected_at, app, window) so get+set in one correction share a UIA connection
+        self._uia_cache: Dict[int, Tuple[float, Any, Any]] = {}
+        # Probes read/write the UIA cache from pool threads as well as the caller
+        self._uia_cache_lock = threading.Lock()
+        # UIA and Win32 fallback probes hit independent subsystems, so run them side by side
+        self._fallback_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="correx-text-probe")
+        # (keyboard layout, virtual key) -> hardware scan code for the chords we send
+        self._scan_codes: Dict[Tuple[Optional[int], int], int] = {}
 
     def select_all_text(self) -> bool:
         """
@@ -51,12 +237,12 @@ class TextBufferManager:
             focused_control = win32gui.GetFocus()
             
             # Send Ctrl+A to select all text
-            print(f"[DEBUG] Sending Ctrl+A to select all text...")
-            self._send_keystroke(win32con.VK_CONTROL, ord('A'))
+            logger.debug("Sending Ctrl+A to select all text...")
+            self._send_keystroke(_VK_CONTROL, ord('A'))
             
             # Now copy it to clipboard (Ctrl+C)
-            print(f"[DEBUG] Sending Ctrl+C to copy text...")
-            self._send_keystroke(win32con.VK_CONTROL, ord('C'))
+            logger.debug("Sending Ctrl+C to copy text...")
+            self._send_keystroke(_VK_CONTROL, ord('C'))
             time.sleep(0.05)
             
             # Restore focus immediately
@@ -66,11 +252,11 @@ class TextBufferManager:
                     if focused_control and win32gui.IsWindow(focused_control):
                         win32gui.SetFocus(focused_control)
             except Exception as focus_error:
-                print(f"[WARNING] Could not restore focus after copy: {focus_error}")
+                logger.warning("Could not restore focus after copy: %s", focus_error)
             
             return True
         except Exception as e:
-            print(f"[ERROR] Failed to select all text: {e}")
+            logger.error("Failed to select all text: %s", e)
             return False
 
     def get_active_text(self) -> Tuple[Optional[str], Optional[any]]:
@@ -93,19 +279,20 @@ class TextBufferManager:
             
             # Validate window handle is still valid
             if not win32gui.IsWindow(hwnd):
-                print(f"[WARNING] Window handle {hwnd} is no longer valid")
+                logger.warning("Window handle %s is no longer valid", hwnd)
                 return None, None
 
-            # PRIMARY: Read from clipboard (should already be there from select_all_text)
+            # PRIMARY: Read from clipboard (should already be there from select_all_text).
+            # Clipboard text is real content, so the window-title heuristic doesn't apply.
             text = self._get_clipboard_text()
-            if text and text.strip() and not self._looks_like_window_title(text):
-                print(f"[DEBUG] Got text from clipboard ({len(text)} chars)")
+            if text and text.strip():
+                logger.debug("Got text from clipboard (%s chars)", len(text))
                 self._last_hwnd = hwnd
                 self._last_text = text
                 return text, hwnd
             
             # FALLBACK: Try other methods if clipboard didn't work
-            print(f"[DEBUG] Clipboard empty, trying other methods...")
+            logger.debug("Clipboard empty, trying other methods...")
             text, control = self._try_get_text_multiple_methods(hwnd)
             
             if text is not None:
@@ -116,7 +303,7 @@ class TextBufferManager:
             return None, None
 
         except Exception as e:
-            print(f"[ERROR] Failed to get active text: {e}")
+            logger.error("Failed to get active text: %s", e)
             return None, None
 
     def set_active_text(self, text: str, control: Optional[any] = None) -> bool:
@@ -135,11 +322,11 @@ class TextBufferManager:
             return False
 
         try:
-            print(f"[REPLACE] Starting text replacement ({len(text)} chars)...")
+            logger.debug("Starting text replacement (%s chars)...", len(text))
             
             # Validate window is still valid if control is a window handle
             if isinstance(control, int) and not win32gui.IsWindow(control):
-                print(f"[WARNING] Window handle {control} is no longer valid, trying foreground window")
+                logger.warning("Window handle %s is no longer valid, trying foreground window", control)
                 control = None
             
             # PRIMARY METHOD: Clipboard paste (most reliable, works everywhere)
@@ -148,47 +335,56 @@ class TextBufferManager:
                 return True
             
             # FALLBACK 1: Try UI Automation
-            print(f"[REPLACE] Clipboard failed, trying UI Automation...")
+            logger.debug("Clipboard failed, trying UI Automation...")
             if self._set_text_via_uiautomation(text):
-                print(f"[REPLACE] ✓ Text replaced via UI Automation")
+                logger.debug("✓ Text replaced via UI Automation")
                 return True
 
             # FALLBACK 2: Try control handle if provided
             if control is not None:
-                print(f"[REPLACE] UI Automation failed, trying control handle...")
+                logger.debug("UI Automation failed, trying control handle...")
                 if self._set_text_via_control(control, text):
-                    print(f"[REPLACE] ✓ Text replaced via control")
+                    logger.debug("✓ Text replaced via control")
                     return True
 
             # FALLBACK 3: Try direct Win32 API
-            print(f"[REPLACE] Control failed, trying Win32 API...")
+            logger.debug("Control failed, trying Win32 API...")
             hwnd = win32gui.GetForegroundWindow()
             if hwnd and win32gui.IsWindow(hwnd):
                 if self._set_text_via_win32(hwnd, text):
-                    print(f"[REPLACE] ✓ Text replaced via Win32")
+                    logger.debug("✓ Text replaced via Win32")
                     return True
 
-            print(f"[ERROR] ✗ All text replacement methods failed!")
+            logger.error("✗ All text replacement methods failed!")
             return False
 
         except Exception as e:
-            print(f"[ERROR] Failed to set active text: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Failed to set active text: %s", e, exc_info=True)
             return False
 
     def _try_get_text_multiple_methods(self, hwnd: int) -> Tuple[Optional[str], Optional[any]]:
         """Try multiple methods to retrieve text from active control."""
         
-        # Method 1: Try UI Automation first (most reliable, non-invasive)
-        text, control = self._get_text_via_pywinauto(hwnd)
-        if text and len(text.strip()) > 0 and not self._looks_like_window_title(text):
-            return text, control
-
-        # Method 2: Try Direct Win32 API (fast, non-invasive but may get window titles)
-        text = self._get_text_via_win32(hwnd)
-        if text and len(text.strip()) > 0 and not self._looks_like_window_title(text):
-            return text, hwnd
+        # Methods 1+2: UI Automation (reliable, slow) and direct Win32 API (fast, may
+        # return window titles) are both non-invasive; take whichever answers first
+        probes = {
+            self._fallback_pool.submit(self._get_text_via_pywinauto, hwnd): "uia",
+            self._fallback_pool.submit(self._get_text_via_win32, hwnd): "win32",
+        }
+        try:
+            for future in as_completed(probes, timeout=FALLBACK_PROBE_TIMEOUT):
+                if probes[future] == "uia":
+                    text, control = future.result()
+                else:
+                    text, control = future.result(), hwnd
+                if text and len(text.strip()) > 0 and not self._looks_like_window_title(text):
+                    # Only drops a probe still queued; one already running finishes
+                    # in the background and its result is ignored
+                    for other in probes:
+                        other.cancel()
+                    return text, control
+        except FuturesTimeoutError:
+            logger.debug("UIA/Win32 text probes timed out")
 
         # Method 3: Try clipboard as last resort (invasive - modifies clipboard)
         text = self._get_text_via_clipboard()
@@ -208,57 +404,83 @@ class TextBufferManager:
         # 3. Don't contain newlines
         # 4. May contain special window title patterns
         
-        if len(text) < 100 and "\n" not in text:
-            # Check for common window title patterns
-            title_patterns = [" - Notepad", " - Word", " - Chrome", " - Firefox", 
-                            " - Microsoft", "*" + text[-10:], "Untitled"]
-            for pattern in title_patterns:
-                if pattern in text:
-                    return True
-        
-        return False
+        if len(text) >= 100 or "\n" in text:
+            return False
+        return text.endswith(_TITLE_SUFFIXES) or any(token in text for token in _TITLE_TOKENS)
 
     def _get_text_via_win32(self, hwnd: int) -> Optional[str]:
         """Get text using Win32 GetWindowText (works for Edit controls)."""
         try:
             # Try getting text from the window itself
-            length = win32gui.SendMessage(hwnd, win32con.WM_GETTEXTLENGTH, 0, 0)
-            if length > 0:
-                # Create buffer for Unicode text (2 bytes per character + null terminator)
-                buffer = win32gui.PyMakeBuffer((length + 1) * 2)
-                result = win32gui.SendMessage(hwnd, win32con.WM_GETTEXT, length + 1, buffer)
-                if result > 0:
-                    # Properly decode the buffer
-                    text = buffer[:result * 2].tobytes().decode('utf-16-le', errors='ignore')
-                    if text.strip():
-                        return text
-
-            # Try focused child control
+            text = self._wm_gettext(hwnd)
+            if text:
+                return text
+
+            # Try focused child control, unless it is the window we just probed
             focused_hwnd = win32gui.GetFocus()
             if focused_hwnd and focused_hwnd != hwnd:
-                length = win32gui.SendMessage(focused_hwnd, win32con.WM_GETTEXTLENGTH, 0, 0)
-                if length > 0:
-                    # Create buffer for Unicode text (2 bytes per character + null terminator)
-                    buffer = win32gui.PyMakeBuffer((length + 1) * 2)
-                    result = win32gui.SendMessage(focused_hwnd, win32con.WM_GETTEXT, length + 1, buffer)
-                    if result > 0:
-                        # Properly decode the buffer
-                        text = buffer[:result * 2].tobytes().decode('utf-16-le', errors='ignore')
-                        if text.strip():
-                            return text
+                return self._wm_gettext(focused_hwnd)
 
         except Exception as e:
-            print(f"[DEBUG] Win32 getText failed: {e}")
+            logger.debug("Win32 getText failed: %s", e)
         
         return None
 
+    def _text_length(self, hwnd: Optional[int]) -> int:
+        """Return WM_GETTEXTLENGTH for hwnd, or -1 when it can't be queried.
+
+        Uses SendMessageTimeoutW so a hung target can't stall the correction.
+        """
+        if not hwnd or _user32 is None:
+            return -1
+        try:
+            result = _ULONG_PTR(0)
+            if not _user32.SendMessageTimeoutW(
+                hwnd, _WM_GETTEXTLENGTH, 0, 0,
+                _SMTO_ABORTIFHUNG, _TEXT_LENGTH_TIMEOUT_MS, ctypes.byref(result),
+            ):
+                return -1
+            return result.value
+        except Exception:
+            return -1
+
+    def _focused_control(self, hwnd: Optional[int]) -> Optional[int]:
+        """Return the control with keyboard focus in hwnd's GUI thread.
+
+        GetFocus() only sees the calling thread's focus and returns 0 for other
+        applications' windows; GetGUIThreadInfo works across threads.
+        """
+        if not hwnd or _user32 is None:
+            return None
+        try:
+            thread_id = _user32.GetWindowThreadProcessId(hwnd, None)
+            info = _GUITHREADINFO(cbSize=ctypes.sizeof(_GUITHREADINFO))
+            if thread_id and _user32.GetGUIThreadInfo(thread_id, ctypes.byref(info)):
+                return info.hwndFocus or None
+        except Exception:
+            pass
+        return None
+
+    def _wm_gettext(self, hwnd: int) -> Optional[str]:
+        """Read a window's text with WM_GETTEXT straight into a wchar_t buffer."""
+        if _user32 is None:
+            return None
+        length = _user32.SendMessageW(hwnd, _WM_GETTEXTLENGTH, 0, 0)
+        if length <= 0:
+            return None
+        buffer = ctypes.create_unicode_buffer(length + 1)
+        if _user32.SendMessageW(hwnd, _WM_GETTEXT, length + 1, ctypes.addressof(buffer)) <= 0:
+            return None
+        text = buffer.value
+        return text if text.strip() else None
+
     def _get_text_via_pywinauto(self, hwnd: int) -> Tuple[Optional[str], Optional[any]]:
         """Get text using pywinauto (works for complex controls)."""
+        if _PywinautoApplication is None:
+            return None, None
+
         try:
-            from pywinauto.application import Application
-            
-            app = Application(backend="uia").connect(handle=hwnd, timeout=1)
-            window = app.window(handle=hwnd)
+            app, window = self._get_uia_window(hwnd)
             
             # Try to find focused edit control
             try:
@@ -285,10 +507,34 @@ class TextBufferManager:
                 pass
 
         except Exception as e:
-            print(f"[DEBUG] pywinauto getText failed: {e}")
+            logger.debug("pywinauto getText failed: %s", e)
         
         return None, None
 
+    def _get_uia_window(self, hwnd: int) -> Tuple[Any, Any]:
+        """Return a (possibly cached) UIA application and window wrapper for hwnd."""
+        now = time.monotonic()
+        with self._uia_cache_lock:
+            entry = self._uia_cache.get(hwnd)
+        if entry is not None:
+            connected_at, app, window = entry
+            if now - connected_at < UIA_CACHE_REUSE_SECONDS and win32gui.IsWindow(hwnd):
+                return app, window
+
+        # Connect outside the lock; it can take up to a second
+        app = _PywinautoApplication(backend="uia").connect(handle=hwnd, timeout=1)
+        window = app.window(handle=hwnd)
+
+        with self._uia_cache_lock:
+            stale = [key for key, (connected_at, _, _) in self._uia_cache.items() if now - connected_at > UIA_CACHE_EXPIRE_SECONDS]
+            for key in stale:
+                del self._uia_cache[key]
+            self._uia_cache[hwnd] = (now, app, window)
+            while len(self._uia_cache) > UIA_CACHE_MAX_ENTRIES:
+                oldest = min(self._uia_cache, key=lambda key: self._uia_cache[key][0])
+                del self._uia_cache[oldest]
+        return app, window
+
     def _get_text_via_clipboard(self) -> Optional[str]:
         """Get text by selecting all and copying to clipboard."""
         try:
@@ -296,10 +542,10 @@ class TextBufferManager:
             original_clipboard = self._get_clipboard_text()
 
             # Select all and copy (Ctrl+A, Ctrl+C)
-            self._send_keystroke(win32con.VK_CONTROL if win32con else 0, ord('A'))
+            self._send_keystroke(_VK_CONTROL, ord('A'))
             time.sleep(0.05)
 
-            self._send_keystroke(win32con.VK_CONTROL if win32con else 0, ord('C'))
+            self._send_keystroke(_VK_CONTROL, ord('C'))
             time.sleep(0.05)
 
             # Get clipboard text
@@ -312,7 +558,7 @@ class TextBufferManager:
             return text if text and text != original_clipboard else None
 
         except Exception as e:
-            print(f"[DEBUG] Clipboard getText failed: {e}")
+            logger.debug("Clipboard getText failed: %s", e)
 
         return None
 
@@ -326,7 +572,7 @@ class TextBufferManager:
                 control.SetWindowText(text)
                 return True
         except Exception as e:
-            print(f"[DEBUG] Control setText failed: {e}")
+            logger.debug("Control setText failed: %s", e)
         
         return False
 
@@ -334,36 +580,33 @@ class TextBufferManager:
         """Set text using Win32 SetWindowText."""
         try:
             # Try main window
-            win32gui.SendMessage(hwnd, win32con.WM_SETTEXT, 0, text)
-            
-            # Verify it worked
-            time.sleep(0.01)
-            length = win32gui.SendMessage(hwnd, win32con.WM_GETTEXTLENGTH, 0, 0)
-            if length > 0:
+            if self._wm_settext(hwnd, text):
                 return True
 
             # Try focused control
             focused_hwnd = win32gui.GetFocus()
             if focused_hwnd and focused_hwnd != hwnd:
-                win32gui.SendMessage(focused_hwnd, win32con.WM_SETTEXT, 0, text)
-                time.sleep(0.01)
-                length = win32gui.SendMessage(focused_hwnd, win32con.WM_GETTEXTLENGTH, 0, 0)
-                if length > 0:
-                    return True
+                return self._wm_settext(focused_hwnd, text)
 
         except Exception as e:
-            print(f"[DEBUG] Win32 setText failed: {e}")
+            logger.debug("Win32 setText failed: %s", e)
         
         return False
 
+    def _wm_settext(self, hwnd: int, text: str) -> bool:
+        """Send WM_SETTEXT and report whether the window now holds any text."""
+        win32gui.SendMessage(hwnd, _WM_SETTEXT, 0, text)
+        time.sleep(0.01)
+        return self._text_length(hwnd) > 0
+
     def _set_text_via_uiautomation(self, text: str) -> bool:
         """Set text using UI Automation."""
+        if _PywinautoApplication is None:
+            return False
+
         try:
             hwnd = win32gui.GetForegroundWindow()
-            from pywinauto.application import Application
-            
-            app = Application(backend="uia").connect(handle=hwnd, timeout=1)
-            window = app.window(handle=hwnd)
+            app, window = self._get_uia_window(hwnd)
             
             # Find focused edit control
             focused = window.descendants(control_type="Edit", depth=10)
@@ -376,7 +619,7 @@ class TextBufferManager:
                     continue
 
         except Exception as e:
-            print(f"[DEBUG] UI Automation setText failed: {e}")
+            logger.debug("UI Automation setText failed: %s", e)
         
         return False
 
@@ -389,32 +632,44 @@ class TextBufferManager:
             # CRITICAL: Save the current window handle to restore focus
             current_hwnd = win32gui.GetForegroundWindow()
             focused_control = win32gui.GetFocus()
+            # GetFocus() only sees this thread's focus; probe the target's own control
+            target_control = self._focused_control(current_hwnd)
             
-            print(f"[CLIPBOARD] Saving original clipboard...")
-            
-            # Save current clipboard
-            original_clipboard = self._get_clipboard_text()
+            logger.debug("Saving original clipboard and setting new text...")
             
-            # Set clipboard to new text
-            print(f"[CLIPBOARD] Setting new text to clipboard...")
-            if not self._set_clipboard_text(text):
-                print(f"[ERROR] Failed to set clipboard")
+            # Save current clipboard and set the new text in one open/close cycle
+            handle = _alloc_unicode_handle(text)
+            try:
+                with self._clipboard_session():
+                    try:
+                        original_clipboard = self._read_unicode_locked()
+                    except Exception:
+                        # Unreadable contents shouldn't block the replacement
+                        original_clipboard = None
+                    self._write_unicode_locked(text, handle)
+                    handle = None  # Owned by the clipboard now
+            except Exception as clipboard_error:
+                logger.error("Failed to set clipboard: %s", clipboard_error)
                 return False
-            
-            # Small delay to ensure clipboard is set
-            time.sleep(0.03)
+            finally:
+                _free_unicode_handle(handle)
             
             # Select all text first (to ensure we replace everything)
-            print(f"[CLIPBOARD] Selecting all text (Ctrl+A)...")
-            self._send_keystroke(win32con.VK_CONTROL if win32con else 0, ord('A'))
+            logger.debug("Selecting all text (Ctrl+A)...")
+            self._send_keystroke(_VK_CONTROL, ord('A'))
             time.sleep(0.05)
 
             # Now paste with Ctrl+V
-            print(f"[CLIPBOARD] Pasting corrected text (Ctrl+V)...")
-            self._send_keystroke(win32con.VK_CONTROL if win32con else 0, ord('V'))
+            logger.debug("Pasting corrected text (Ctrl+V)...")
+            length_before = self._text_length(target_control)
+            self._send_keystroke(_VK_CONTROL, ord('V'))
             
-            # Wait for paste to complete
-            time.sleep(0.08)
+            # Wait for paste to complete: stop early once the control's text length
+            # changes; controls that don't report a length use the full budget
+            if length_before >= 0:
+                _wait_for(lambda: self._text_length(target_control) != length_before, 0.08)
+            else:
+                time.sleep(0.08)
             
             # CRITICAL: Restore focus to original window/control
             try:
@@ -423,38 +678,84 @@ class TextBufferManager:
                     if focused_control and win32gui.IsWindow(focused_control):
                         win32gui.SetFocus(focused_control)
             except Exception as focus_error:
-                print(f"[WARNING] Could not restore focus: {focus_error}")
+                logger.warning("Could not restore focus: %s", focus_error)
             
             # Restore original clipboard
-            print(f"[CLIPBOARD] Restoring original clipboard...")
+            logger.debug("Restoring original clipboard...")
             if original_clipboard is not None:
                 self._set_clipboard_text(original_clipboard)
             
-            print(f"[CLIPBOARD] ✓ Text replacement completed!")
+            logger.debug("✓ Text replacement completed!")
             return True
 
         except Exception as e:
-            print(f"[ERROR] Clipboard setText failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Clipboard setText failed: %s", e, exc_info=True)
             return False
 
+    @contextmanager
+    def _clipboard_session(self) -> Iterator[None]:
+        """Open the clipboard once (with retry/backoff) and close it on exit."""
+        for attempt in range(MAX_CLIPBOARD_RETRIES):
+            try:
+                win32clipboard.OpenClipboard()
+                break
+            except Exception as clipboard_error:
+                logger.debug("Clipboard open attempt %s failed: %s", attempt + 1, clipboard_error)
+                time.sleep(_clipboard_backoff(attempt))
+        else:
+            raise RuntimeError(f"Clipboard unavailable after {MAX_CLIPBOARD_RETRIES} attempts")
+
+        try:
+            yield
+        finally:
+            win32clipboard.CloseClipboard()
+
+    def _clipboard_sequence(self) -> int:
+        """Return the clipboard sequence number, or 0 when unavailable."""
+        if _user32 is None:
+            return 0
+        try:
+            return _user32.GetClipboardSequenceNumber()
+        except Exception:
+            return 0
+
+    def _read_unicode_locked(self) -> Optional[str]:
+        """Read CF_UNICODETEXT; the clipboard must already be open."""
+        if win32clipboard.IsClipboardFormatAvailable(_CF_UNICODETEXT):
+            return win32clipboard.GetClipboardData(_CF_UNICODETEXT)
+        return None
+
+    def _write_unicode_locked(self, text: str, handle: Optional[int] = None) -> None:
+        """Replace clipboard contents with text; the clipboard must already be open.
+
+        When a pre-filled handle from _alloc_unicode_handle is given it is
+        handed over as-is; on success the clipboard owns it.
+        """
+        self._cached_seq = 0
+        win32clipboard.EmptyClipboard()
+        win32clipboard.SetClipboardData(_CF_UNICODETEXT, handle if handle else text)
+        self._cached_seq = self._clipboard_sequence()
+        self._cached_text = text
+
     def _get_clipboard_text(self) -> Optional[str]:
         """Get text from Windows clipboard."""
         if win32clipboard is None or win32con is None:
             return None
 
-        for attempt in range(MAX_CLIPBOARD_RETRIES):
-            try:
-                win32clipboard.OpenClipboard()
-                try:
-                    if win32clipboard.IsClipboardFormatAvailable(win32con.CF_UNICODETEXT):
-                        return win32clipboard.GetClipboardData(win32con.CF_UNICODETEXT)
-                finally:
-                    win32clipboard.CloseClipboard()
-            except Exception as clipboard_error:
-                print(f"[DEBUG] Clipboard read attempt {attempt + 1} failed: {clipboard_error}")
-                time.sleep(CLIPBOARD_RETRY_DELAY)
+        # Skip OpenClipboard entirely if nobody has touched the clipboard since our last access
+        seq = self._clipboard_sequence()
+        if seq and seq == self._cached_seq and self._cached_text is not None:
+            return self._cached_text
+
+        try:
+            with self._clipboard_session():
+                text = self._read_unicode_locked()
+            if text is not None:
+                self._cached_seq = seq
+                self._cached_text = text
+            return text
+        except Exception as clipboard_error:
+            logger.debug("Clipboard read failed: %s", clipboard_error)
         return None
 
     def _set_clipboard_text(self, text: str) -> bool:
@@ -462,30 +763,76 @@ class TextBufferManager:
         if win32clipboard is None or win32con is None:
             return False
 
-        for attempt in range(MAX_CLIPBOARD_RETRIES):
-            try:
-                win32clipboard.OpenClipboard()
-                try:
-                    win32clipboard.EmptyClipboard()
-                    win32clipboard.SetClipboardData(win32con.CF_UNICODETEXT, text)
-                    return True
-                finally:
-                    win32clipboard.CloseClipboard()
-            except Exception as clipboard_error:
-                print(f"[ERROR] Failed to set clipboard (attempt {attempt + 1}): {clipboard_error}")
-                time.sleep(CLIPBOARD_RETRY_DELAY)
+        handle = _alloc_unicode_handle(text)
+        try:
+            with self._clipboard_session():
+                self._write_unicode_locked(text, handle)
+                handle = None  # Owned by the clipboard now
+            return True
+        except Exception as clipboard_error:
+            logger.error("Failed to set clipboard: %s", clipboard_error)
+        finally:
+            _free_unicode_handle(handle)
         return False
 
+    def _foreground_layout(self) -> Optional[int]:
+        """Return the keyboard layout (HKL) of the foreground window's thread.
+
+        Layouts are per thread and can change at any time, so this is looked up
+        at send time rather than using the service thread's own layout.
+        """
+        if _user32 is None:
+            return None
+        try:
+            hwnd = _user32.GetForegroundWindow()
+            thread_id = _user32.GetWindowThreadProcessId(hwnd, None) if hwnd else 0
+            return _user32.GetKeyboardLayout(thread_id)
+        except Exception:
+            return None
+
+    def _scan_code(self, vk: int, layout: Optional[int]) -> int:
+        """Return the (cached) scan code for a virtual key in layout, or 0 if unmapped."""
+        key = (layout, vk)
+        scan = self._scan_codes.get(key)
+        if scan is None:
+            scan = 0
+            if _user32 is not None:
+                try:
+                    scan = _user32.MapVirtualKeyExW(vk, MAPVK_VK_TO_VSC, layout)
+                except Exception:
+                    scan = 0
+            self._scan_codes[key] = scan
+        return scan
+
     def _send_keystroke(self, modifier: int, keycode: int) -> None:
-        """Send a modifier+key keystroke with basic error handling."""
-        if win32api is None or win32con is None:
+        """Send a modifier+key chord as one atomic SendInput batch."""
+        if _user32 is None:
             return
 
+        keyup = _KEYEVENTF_KEYUP
+        events = (
+            (modifier, 0),
+            (keycode, 0),
+            (keycode, keyup),
+            (modifier, keyup),
+        )
+        # Map with the receiving app's layout so the scan code round-trips to the same VK
+        layout = self._foreground_layout()
+        inputs = (_INPUT * len(events))()
+        for item, (vk, flags) in zip(inputs, events):
+            item.type = INPUT_KEYBOARD
+            item.u.ki.wVk = vk
+            # Scan codes make the event look like a physical key press, so the
+            # active IME/layout doesn't re-translate (or swallow) it
+            scan = self._scan_code(vk, layout)
+            if scan:
+                item.u.ki.wScan = scan
+                flags |= KEYEVENTF_SCANCODE
+            item.u.ki.dwFlags = flags
+
         try:
-            win32api.keybd_event(modifier, 0, 0, 0)
-            win32api.keybd_event(keycode, 0, 0, 0)
-            time.sleep(0.02)
-            win32api.keybd_event(keycode, 0, win32con.KEYEVENTF_KEYUP, 0)
-            win32api.keybd_event(modifier, 0, win32con.KEYEVENTF_KEYUP, 0)
+            sent = _user32.SendInput(len(events), inputs, ctypes.sizeof(_INPUT))
+            if sent != len(events):
+                logger.warning("SendInput delivered %s/%s events for %s+%s", sent, len(events), modifier, keycode)
         except Exception as e:
-            print(f"[WARNING] Failed to send keystroke {modifier}+{keycode}: {e}")
+            logger.warning("Failed to send keystroke %s+%s: %s", modifier, keycode, e)
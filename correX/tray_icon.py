@@ -1,7 +1,9 @@
 """System tray icon manager."""
 from __future__ import annotations
 
+import io
 import os
+import queue
 import threading
 from pathlib import Path
 from typing import Optional, Callable, TYPE_CHECKING, Any
@@ -55,7 +57,16 @@ class TrayIcon:
             print(f"[WARNING] Tray logo not found at: {self.logo_path}")
             self.logo_path = None
         
-        self._logo_cache: dict[bool, Any] = {}
+        # Composited icons stored as compact PNG bytes, keyed by enabled state
+        self._logo_cache: dict[bool, bytes] = {}
+        
+        # Menu labels/checks are lambdas over service_enabled, so one instance stays current
+        self._menu = self.create_menu()
+        
+        # Fallback message boxes are shown one at a time by a single worker thread
+        self._fallback_queue: queue.Queue[tuple[str, str]] = queue.Queue(maxsize=8)
+        self._fallback_worker: Optional[threading.Thread] = None
+        self._fallback_lock = threading.Lock()
         
         self.icon = None
         self._running = False
@@ -65,8 +76,9 @@ class TrayIcon:
         if Image is None:
             return None
 
-        if enabled in self._logo_cache:
-            return self._logo_cache[enabled]
+        cached = self._logo_cache.get(enabled)
+        if cached is not None:
+            return Image.open(io.BytesIO(cached))
 
         if self.logo_path:
             try:
@@ -81,7 +93,7 @@ class TrayIcon:
                             image = enhancer.enhance(0.75)
                         overlay = Image.new("RGBA", image.size, (220, 53, 69, 90))
                         image = Image.alpha_composite(image, overlay)
-                    self._logo_cache[enabled] = image
+                    self._cache_image(enabled, image)
                     return image
             except Exception as e:
                 print(f"[WARNING] Failed to load tray logo: {e}")
@@ -109,8 +121,17 @@ class TrayIcon:
         text_height = bbox[3] - bbox[1]
         position = ((width - text_width) // 2, (height - text_height) // 2)
         draw.text(position, text, fill='white')
-        self._logo_cache[enabled] = image
+        self._cache_image(enabled, image)
         return image
+
+    def _cache_image(self, enabled: bool, image: Any) -> None:
+        """Store a composited icon as PNG bytes for cheap re-materialization."""
+        try:
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG", optimize=True)
+            self._logo_cache[enabled] = buffer.getvalue()
+        except Exception as e:
+            print(f"[WARNING] Failed to cache tray icon: {e}")
     
     def create_menu(self) -> Any:
         """Create tray menu."""
@@ -153,13 +174,12 @@ class TrayIcon:
         
         self._running = True
         
-        # Create icon
-        icon_image = self.create_icon_image(self.service_enabled)
+        # Create icon; the image itself is rendered on the tray thread in _run_icon
         self.icon = pystray.Icon(
             "CorreX",
-            icon_image,
+            None,
             f"CorreX - {'Running' if self.service_enabled else 'Paused'}",
-            self.create_menu()
+            self._menu
         )
         
         # Run in separate thread
@@ -171,6 +191,8 @@ class TrayIcon:
     def _run_icon(self) -> None:
         """Run the icon (blocking call)."""
         try:
+            # Render here so PIL decode/resize stays off the main startup thread
+            self.icon.icon = self.create_icon_image(self.service_enabled)
             self.icon.run()
         except Exception as e:
             print(f"[ERROR] Tray icon error: {e}")
@@ -190,8 +212,8 @@ class TrayIcon:
             self.icon.icon = self.create_icon_image(enabled)
             self.icon.title = f"CorreX - {'Running' if enabled else 'Paused'}"
             
-            # Update menu
-            self.icon.menu = self.create_menu()
+            # Re-evaluate the dynamic menu items without rebuilding the menu
+            self.icon.update_menu()
     
     def show_notification(self, title: str, message: str) -> None:
         """Show system tray notification."""
@@ -209,25 +231,39 @@ class TrayIcon:
         """Fallback notification path when native tray notifications fail."""
         if os.name == "nt":
             try:
-                import ctypes
-
-                def _show_box() -> None:
-                    try:
-                        ctypes.windll.user32.MessageBoxW(  # type: ignore[attr-defined]
-                            None,
-                            message,
-                            title,
-                            0x00000040 | 0x00010000  # MB_ICONINFORMATION | MB_SETFOREGROUND
-                        )
-                    except Exception:
-                        pass
-
-                threading.Thread(target=_show_box, daemon=True).start()
+                self._ensure_fallback_worker()
+                self._fallback_queue.put_nowait((title, message))
+                return
+            except queue.Full:
+                # Message boxes are already stacked up; drop the excess
                 return
             except Exception as fallback_error:
                 print(f"[WARNING] Tray notification fallback failed: {fallback_error}")
 
         print(f"[NOTICE] {title}: {message}")
+
+    def _ensure_fallback_worker(self) -> None:
+        """Start the message-box worker thread on first use."""
+        with self._fallback_lock:
+            if self._fallback_worker is None or not self._fallback_worker.is_alive():
+                self._fallback_worker = threading.Thread(target=self._run_fallback_worker, daemon=True)
+                self._fallback_worker.start()
+
+    def _run_fallback_worker(self) -> None:
+        """Show queued fallback notifications as Windows message boxes."""
+        import ctypes
+
+        while True:
+            title, message = self._fallback_queue.get()
+            try:
+                ctypes.windll.user32.MessageBoxW(  # type: ignore[attr-defined]
+                    None,
+                    message,
+                    title,
+                    0x00000040 | 0x00010000  # MB_ICONINFORMATION | MB_SETFOREGROUND
+                )
+            except Exception:
+                pass
     
     def _on_show_gui(self, icon, item) -> None:
         """Handle show GUI menu item."""
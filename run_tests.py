@@ -2,16 +2,30 @@
 """Test runner script for CorreX project."""
 from __future__ import annotations
 
+import importlib.util
+import os
 import sys
-import subprocess
 from pathlib import Path
 
+import pytest
 
-def run_tests(args: list[str] | None = None) -> int:
+
+def run_tests(
+    args: list[str] | None = None,
+    *,
+    quick: bool = False,
+    no_cache: bool = False,
+    coverage: bool = False,
+    html: bool = False,
+) -> int:
     """Run pytest with specified arguments.
     
     Args:
         args: Additional pytest arguments
+        quick: Re-run last failures first (--lf --ff)
+        no_cache: Disable pytest's cache provider
+        coverage: Collect coverage (also enabled by CORREX_COV=1)
+        html: Also write the HTML coverage report (implies coverage)
         
     Returns:
         Exit code from pytest
@@ -23,20 +37,35 @@ def run_tests(args: list[str] | None = None) -> int:
     if args:
         cmd.extend(args)
     else:
-        # Default: run all tests with coverage
+        cmd.append("-v")
+        # Run in parallel when pytest-xdist is installed; plain pytest rejects -n
+        if importlib.util.find_spec("xdist") is not None:
+            cmd.extend(["-n", "auto", "--dist=loadfile"])
+    
+    if html or coverage or os.environ.get("CORREX_COV") == "1":
+        # sys.monitoring based tracing is much cheaper than settrace, but only exists on 3.12+
+        if sys.version_info >= (3, 12):
+            os.environ.setdefault("COVERAGE_CORE", "sysmon")
         cmd.extend([
-            "-v",
             "--cov=correX",
             "--cov-report=term-missing",
-            "--cov-report=html",
         ])
+        if html:
+            cmd.append("--cov-report=html")
+    
+    if quick:
+        cmd.extend(["--lf", "--ff"])
+    
+    if no_cache:
+        cmd.extend(["-p", "no:cacheprovider"])
     
     print(f"Running: {' '.join(cmd)}")
     print(f"Working directory: {project_root}")
     print("-" * 60)
     
-    result = subprocess.run(cmd, cwd=project_root)
-    return result.returncode
+    # Run in-process instead of spawning a fresh interpreter
+    os.chdir(project_root)
+    return int(pytest.main(cmd[1:]))
 
 
 def main() -> int:
@@ -46,31 +75,49 @@ def main() -> int:
     print("=" * 60)
     print()
     
-    # Pass command-line arguments to pytest
-    args = sys.argv[1:] if len(sys.argv) > 1 else None
+    # Pass command-line arguments to pytest, minus the runner's own flags
+    argv = sys.argv[1:]
+    quick = "--quick" in argv
+    no_cache = "--no-cache" in argv
+    coverage = "--coverage" in argv
+    html = "--html" in argv
+    runner_flags = ("--quick", "--no-cache", "--coverage", "--html")
+    args = [arg for arg in argv if arg not in runner_flags] or None
     
     if args and args[0] in ["-h", "--help"]:
-        print("Usage: python run_tests.py [pytest arguments]")
+        print("Usage: python run_tests.py [--quick] [--no-cache] [--coverage] [--html] [pytest arguments]")
         print()
         print("Examples:")
-        print("  python run_tests.py                    # Run all tests with coverage")
+        print("  python run_tests.py                    # Run all tests (in parallel with pytest-xdist)")
+        print("  python run_tests.py --coverage         # Also collect coverage (or CORREX_COV=1)")
+        print("  python run_tests.py --html             # Coverage plus HTML report in htmlcov/")
+        print("  python run_tests.py -n 0               # Run serially (e.g. for --pdb)")
+        print("  python run_tests.py --quick            # Re-run last failures first (--lf --ff)")
+        print("  python run_tests.py --no-cache         # Skip .pytest_cache (e.g. in CI; not with --quick)")
         print("  python run_tests.py tests/test_*.py    # Run specific tests")
         print("  python run_tests.py -k buffer          # Run tests matching 'buffer'")
         print("  python run_tests.py -m unit            # Run only unit tests")
         print("  python run_tests.py -v -s              # Verbose with print output")
-        print("  python run_tests.py --cov-report=xml   # Generate XML coverage report")
+        print("  python run_tests.py --cov=correX --cov-report=xml  # Generate XML coverage report")
         return 0
     
-    exit_code = run_tests(args)
+    if quick and no_cache:
+        # --lf/--ff come from the cache provider that --no-cache disables
+        print("error: --quick and --no-cache cannot be used together", file=sys.stderr)
+        return 2
+    
+    exit_code = run_tests(args, quick=quick, no_cache=no_cache, coverage=coverage, html=html)
     
     print()
     print("=" * 60)
     if exit_code == 0:
         print("✅ All tests passed!")
-        print()
-        print("View coverage report:")
-        print("  - Console: See output above")
-        print("  - HTML: Open htmlcov/index.html")
+        if html or coverage or os.environ.get("CORREX_COV") == "1":
+            print()
+            print("View coverage report:")
+            print("  - Console: See output above")
+            if html:
+                print("  - HTML: Open htmlcov/index.html")
     else:
         print("❌ Some tests failed!")
         print()
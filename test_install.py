@@ -2,9 +2,35 @@
 """Quick test script to verify CorreX installation and basic imports."""
 from __future__ import annotations
 
+import contextlib
+import importlib
+import importlib.util
+import io
+import os
 import sys
 from pathlib import Path
 
+# Shared with tests/test_imports.py, which runs the same checks under pytest
+CORE_MODULES = [
+    ("correX.main", "Main entry point"),
+    ("correX.autocorrect_service", "Autocorrect service"),
+    ("correX.gemini_corrector", "Gemini API corrector"),
+    ("correX.keystroke_buffer", "Keystroke buffer"),
+    ("correX.text_buffer", "Text buffer"),
+    ("correX.config_manager", "Config manager"),
+    ("correX.history_manager", "History manager"),
+    ("correX.logger", "Logging system"),
+    ("correX.asset_manager", "Asset manager"),
+    ("correX.gui.app_gui", "GUI application"),
+]
+
+OPTIONAL_MODULES = [
+    ("correX.dictation_manager", "Dictation manager"),
+    ("correX.tray_icon", "System tray icon"),
+    ("correX.loading_overlay", "Loading overlay"),
+    ("correX.mic_overlay", "Microphone overlay"),
+]
+
 
 def test_imports():
     """Test that all core modules can be imported."""
@@ -23,40 +49,20 @@ def test_imports():
         print(f"❌ Failed to import correX: {e}")
     
     # Test core modules
-    modules = [
-        ("correX.main", "Main entry point"),
-        ("correX.autocorrect_service", "Autocorrect service"),
-        ("correX.gemini_corrector", "Gemini API corrector"),
-        ("correX.keystroke_buffer", "Keystroke buffer"),
-        ("correX.text_buffer", "Text buffer"),
-        ("correX.config_manager", "Config manager"),
-        ("correX.history_manager", "History manager"),
-        ("correX.logger", "Logging system"),
-        ("correX.asset_manager", "Asset manager"),
-        ("correX.gui.app_gui", "GUI application"),
-    ]
-    
     print("\nCore Modules:")
-    for module_name, description in modules:
+    for module_name, description in CORE_MODULES:
         try:
-            __import__(module_name)
+            importlib.import_module(module_name)
             print(f"✅ {module_name:30s} - {description}")
         except ImportError as e:
             failures.append((module_name, str(e)))
             print(f"❌ {module_name:30s} - FAILED: {e}")
     
     # Test optional modules
-    optional_modules = [
-        ("correX.dictation_manager", "Dictation manager"),
-        ("correX.tray_icon", "System tray icon"),
-        ("correX.loading_overlay", "Loading overlay"),
-        ("correX.mic_overlay", "Microphone overlay"),
-    ]
-    
     print("\nOptional Modules:")
-    for module_name, description in optional_modules:
+    for module_name, description in OPTIONAL_MODULES:
         try:
-            __import__(module_name)
+            importlib.import_module(module_name)
             print(f"✅ {module_name:30s} - {description}")
         except ImportError as e:
             print(f"⚠️  {module_name:30s} - Not available: {e}")
@@ -64,6 +70,15 @@ def test_imports():
     return failures
 
 
+def _is_installed(module_name: str) -> bool:
+    """Check that a module can be located without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        # Parent package missing (e.g. "google" for "google.generativeai")
+        return False
+
+
 def test_dependencies():
     """Test that required dependencies are installed."""
     print("\n" + "="*60)
@@ -86,10 +101,9 @@ def test_dependencies():
     missing_optional = []
     
     for module_name, description, required in dependencies:
-        try:
-            __import__(module_name)
+        if _is_installed(module_name):
             print(f"✅ {module_name:30s} - {description}")
-        except ImportError:
+        else:
             if required:
                 missing_required.append((module_name, description))
                 print(f"❌ {module_name:30s} - REQUIRED: {description}")
@@ -113,11 +127,7 @@ def test_assets():
         Path(__file__).parent / "correX" / "assets",
     ]
     
-    assets_dir = None
-    for path in possible_paths:
-        if path.exists():
-            assets_dir = path
-            break
+    assets_dir = next((path for path in possible_paths if path.exists()), None)
     
     if not assets_dir:
         print("⚠️  Assets directory not found in expected locations")
@@ -128,18 +138,22 @@ def test_assets():
     # Check for icon files
     icons_dir = assets_dir / "icons"
     if icons_dir.exists():
-        icons = list(icons_dir.glob("*.ico"))
+        icons = [
+            entry.name
+            for entry in os.scandir(icons_dir)
+            if entry.name.endswith(".ico") and entry.is_file(follow_symlinks=False)
+        ]
         print(f"✅ Found {len(icons)} icon files:")
         for icon in icons:
-            print(f"   - {icon.name}")
+            print(f"   - {icon}")
     else:
         print("⚠️  Icons directory not found")
     
     return True
 
 
-def main():
-    """Run all tests."""
+def _run_checks() -> int:
+    """Run all checks and return the process exit code."""
     print("="*60)
     print("CorreX Installation Test")
     print("="*60)
@@ -183,11 +197,23 @@ def main():
     # Exit code
     if import_failures or missing_required:
         print("\n❌ Tests FAILED - Installation incomplete")
-        sys.exit(1)
+        return 1
     else:
         print("\n✅ Tests PASSED - Installation looks good!")
         print("\nYou can now run CorreX with: python -m correX")
-        sys.exit(0)
+        return 0
+
+
+def main():
+    """Run all tests, buffering the report and writing it out in one go."""
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            exit_code = _run_checks()
+    finally:
+        sys.stdout.write(output.getvalue())
+        sys.stdout.flush()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
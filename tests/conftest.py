@@ -0,0 +1,40 @@
+"""Shared pytest fixtures for the CorreX test suite."""
+import io
+
+import pytest
+
+from correX.config_manager import ConfigManager
+
+
+class _MemoryFile(io.BytesIO):
+    """BytesIO that stores its contents in the backing dict when closed."""
+
+    def __init__(self, files, path):
+        super().__init__()
+        self._files = files
+        self._path = path
+
+    def close(self):
+        if not self.closed:
+            self._files[self._path] = self.getvalue()
+        super().close()
+
+
+@pytest.fixture
+def memfs_config(monkeypatch):
+    """Route ConfigManager load/save through an in-memory {path: bytes} dict."""
+    files = {}
+
+    def opener(path, mode="r", encoding=None, **_kwargs):
+        path = str(path)
+        if "w" in mode:
+            stream = _MemoryFile(files, path)
+        elif path in files:
+            stream = io.BytesIO(files[path])
+        else:
+            raise FileNotFoundError(path)
+        return stream if "b" in mode else io.TextIOWrapper(stream, encoding=encoding)
+
+    # staticmethod() so the instance isn't bound as the first argument
+    monkeypatch.setattr(ConfigManager, "_file_opener", staticmethod(opener))
+    return files
@@ -0,0 +1,42 @@
+"""Tests for the JSON-backed configuration manager."""
+import json
+
+from correX.config_manager import ConfigManager
+
+
+def test_save_and_load_config(memfs_config, tmp_path):
+    """Saved values are read back by a fresh manager."""
+    config_path = tmp_path / "test_config.json"
+    config = ConfigManager(config_path=config_path)
+
+    config.set_model_name("gemini-test")
+    config.set_versions_per_correction(4)
+
+    reloaded = ConfigManager(config_path=config_path)
+    assert reloaded.get_model_name() == "gemini-test"
+    assert reloaded.get_versions_per_correction() == 4
+
+
+def test_config_persistence(memfs_config, tmp_path):
+    """Saves go through the opener hook, not the real filesystem."""
+    config_path = tmp_path / "test_config.json"
+    config = ConfigManager(config_path=config_path)
+
+    config.set_api_key("secret-key")
+
+    assert not config_path.exists()
+    stored = json.loads(memfs_config[str(config_path)])
+    assert stored["api_key"] == "secret-key"
+    assert ConfigManager(config_path=config_path).get_api_key() == "secret-key"
+
+
+def test_invalid_json_handling(memfs_config, tmp_path):
+    """Unparseable config falls back to defaults."""
+    config_path = tmp_path / "test_config.json"
+    memfs_config[str(config_path)] = b"{not valid json"
+
+    config = ConfigManager(config_path=config_path)
+    defaults = ConfigManager(config_path=tmp_path / "missing.json")
+
+    assert config.config == defaults.config
+    assert config.get_api_key() is None
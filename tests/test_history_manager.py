@@ -0,0 +1,221 @@
+"""Tests for the SQLite-backed correction history."""
+import threading
+from pathlib import Path
+
+import pytest
+
+from correX.history_manager import HistoryManager
+
+
+@pytest.fixture(params=["file", "memory"])
+def history(request, tmp_path):
+    """A manager on a tmp_path database file or in memory, without the cleanup thread."""
+    db_path = tmp_path / "history.db" if request.param == "file" else ":memory:"
+    manager = HistoryManager(db_path=db_path, auto_cleanup=False)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def memory_history():
+    """A second, empty in-memory manager."""
+    manager = HistoryManager(db_path=":memory:", auto_cleanup=False)
+    yield manager
+    manager.close()
+
+
+def test_round_trip(history):
+    """A saved correction can be read back."""
+    assert history.add_correction("teh cat", "the cat", 2, 3, "notepad")
+
+    rows = history.get_recent_corrections()
+
+    assert len(rows) == 1
+    assert rows[0]["original_text"] == "teh cat"
+    assert rows[0]["corrected_text"] == "the cat"
+    assert rows[0]["selected_version"] == 2
+    assert rows[0]["total_versions"] == 3
+    assert rows[0]["application"] == "notepad"
+    assert history.search_corrections("cat")[0]["id"] == rows[0]["id"]
+
+
+def test_add_corrections_bulk(history):
+    """Bulk inserts store every row and add up the daily statistics."""
+    rows = [(f"orig {i}", f"fixed text {i}", "notepad" if i % 2 else None) for i in range(100)]
+    assert history.add_correction("single", "one two")
+
+    assert history.add_corrections(rows)
+
+    stored = history.get_recent_corrections(limit=200)
+    assert len(stored) == 101
+    assert {row["original_text"] for row in stored} == {"single"} | {original for original, _, _ in rows}
+    stats = history.get_statistics()
+    assert len(stats["daily_stats"]) == 1
+    assert stats["total_corrections"] == 101
+    assert stats["total_characters"] == len("one two") + sum(len(c) for _, c, _ in rows)
+    assert stats["total_words"] == 2 + 3 * len(rows)
+
+
+def test_add_corrections_empty(history):
+    """An empty batch succeeds without touching the statistics."""
+    assert history.add_corrections([])
+
+    assert history.get_recent_corrections() == []
+    assert history.get_statistics()["daily_stats"] == []
+
+
+@pytest.mark.parametrize("rows", [
+    pytest.param([("a", "b c", None), ("d", "e")], id="missing-field"),
+    pytest.param([("a", "b c", None), ("d", None, None)], id="non-text-correction"),
+])
+def test_add_corrections_rejects_malformed_batch(history, rows):
+    """A malformed row fails the whole batch without a partial insert."""
+    assert not history.add_corrections(rows)
+
+    assert history.get_recent_corrections() == []
+    assert history.get_statistics()["daily_stats"] == []
+
+
+def test_backup_to_manager(history, memory_history):
+    """A fresh in-memory manager can be seeded from this one."""
+    history.add_corrections([("a", "b c", None), ("d", "e", "word")])
+
+    assert history.backup_to(memory_history)
+
+    assert memory_history.get_recent_corrections() == history.get_recent_corrections()
+    assert memory_history.get_statistics() == history.get_statistics()
+    # The copy is independent of its source
+    memory_history.add_correction("x", "y")
+    assert len(history.get_recent_corrections()) == 2
+
+
+def test_backup_to_path(history, tmp_path):
+    """Backing up to a path writes a database HistoryManager can open."""
+    history.add_correction("teh", "the")
+    backup_path = tmp_path / "backup.db"
+
+    assert history.backup_to(backup_path)
+
+    restored = HistoryManager(db_path=backup_path, auto_cleanup=False)
+    try:
+        assert restored.get_recent_corrections()[0]["corrected_text"] == "the"
+    finally:
+        restored.close()
+
+
+def test_backup_to_closed_manager_fails(history, memory_history):
+    """Backups from or into a closed manager report failure."""
+    memory_history.close()
+
+    assert not history.backup_to(memory_history)
+    assert not memory_history.backup_to(history)
+
+
+def test_cross_backups_do_not_deadlock(history, memory_history):
+    """Two managers backing up into each other concurrently both finish."""
+    history.add_correction("a", "b")
+    memory_history.add_correction("c", "d")
+
+    def copy_many(source, target):
+        for _ in range(50):
+            source.backup_to(target)
+
+    threads = [
+        threading.Thread(target=copy_many, args=(history, memory_history), daemon=True),
+        threading.Thread(target=copy_many, args=(memory_history, history), daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+        assert not thread.is_alive(), "backup_to deadlocked"
+
+
+def test_calls_after_close_fail_gracefully(history):
+    """Once closed, every call reports failure instead of raising."""
+    history.add_correction("a", "b")
+    history.close()
+
+    assert not history.add_correction("c", "d")
+    assert not history.add_corrections([("e", "f", None)])
+    assert history.get_recent_corrections() == []
+    assert history.search_corrections("a") == []
+    assert history.get_statistics()["total_corrections"] == 0
+    assert not history.clear_history()
+    # Closing twice is harmless
+    history.close()
+
+
+def test_concurrent_add_correction(history):
+    """Threads share the one connection without losing writes."""
+    threads_count, per_thread = 8, 25
+    results = []
+    results_lock = threading.Lock()
+
+    def worker(worker_id):
+        for i in range(per_thread):
+            ok = history.add_correction(f"orig {worker_id}-{i}", f"fixed {worker_id} {i}")
+            with results_lock:
+                results.append(ok)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    total = threads_count * per_thread
+    assert results == [True] * total
+    assert len(history.get_recent_corrections(limit=total + 10)) == total
+    assert history.get_statistics()["total_corrections"] == total
+
+
+@pytest.fixture
+def open_history():
+    """Open managers with the given arguments and close them after the test."""
+    managers = []
+
+    def _open(**kwargs):
+        manager = HistoryManager(auto_cleanup=False, **kwargs)
+        managers.append(manager)
+        return manager
+
+    yield _open
+    for manager in managers:
+        manager.close()
+
+
+@pytest.mark.parametrize("to_db_path", [lambda p: p, str], ids=["path", "str"])
+def test_db_path_creates_parent_directories(open_history, tmp_path, to_db_path):
+    """An explicit path is used as-is, creating missing parents."""
+    db_path = to_db_path(tmp_path / "a" / "b" / "history.db")
+
+    history = open_history(db_path=db_path)
+
+    assert history.db_file == Path(db_path)
+    assert history.db_dir == Path(db_path).parent
+    assert Path(db_path).exists()
+
+
+def test_default_location_is_under_home(open_history, tmp_path, monkeypatch):
+    """Without db_path the database goes to ~/.correx/<db_file>."""
+    monkeypatch.setattr("correX.history_manager.Path.home", lambda: tmp_path)
+
+    history = open_history(db_file="custom.db")
+
+    assert history.db_file == tmp_path / ".correx" / "custom.db"
+    assert history.db_file.exists()
+
+
+def test_memory_databases_are_isolated(open_history):
+    """Each ":memory:" manager gets its own empty database and no file."""
+    first = open_history(db_path=":memory:")
+    second = open_history(db_path=":memory:")
+
+    first.add_correction("a", "b")
+
+    assert first.db_file == ":memory:"
+    assert first.db_dir is None
+    assert not Path(":memory:").exists()
+    assert len(first.get_recent_corrections()) == 1
+    assert second.get_recent_corrections() == []
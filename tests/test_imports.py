@@ -0,0 +1,24 @@
+"""Import checks for every CorreX module, sharing test_install.py's module lists."""
+import importlib
+
+import pytest
+
+from test_install import CORE_MODULES, OPTIONAL_MODULES
+
+
+@pytest.mark.parametrize("module_name", ["correX"] + [name for name, _ in CORE_MODULES])
+def test_core_module_imports(module_name):
+    """Core modules import; a missing third-party or Windows-only dependency skips."""
+    try:
+        importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        # Same outcome as pytest.importorskip for the dependency; broken correX imports still fail
+        if e.name and e.name.partition(".")[0] != "correX":
+            pytest.skip(f"{module_name} needs {e.name}")
+        raise
+
+
+@pytest.mark.parametrize("module_name", [name for name, _ in OPTIONAL_MODULES])
+def test_optional_module_imports(module_name):
+    """Optional modules are skipped when their extra dependencies are missing."""
+    pytest.importorskip(module_name)
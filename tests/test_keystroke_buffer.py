@@ -0,0 +1,206 @@
+"""Tests for the per-window keystroke buffer."""
+import os
+import unittest
+from collections import OrderedDict, deque
+from time import perf_counter_ns
+from typing import Final
+
+from correX.keystroke_buffer import KeystrokeBuffer
+
+# Window handles shared by the tests; the buffer keys them as plain ints
+HWND_A: Final[int] = 12345
+HWND_B: Final[int] = 67890
+
+
+class TestKeystrokeBuffer(unittest.TestCase):
+    """Test KeystrokeBuffer storage, caching and LRU behaviour."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one buffer for the class; setUp resets its state."""
+        cls.buffer = KeystrokeBuffer(max_buffer_size=100)
+
+    def setUp(self):
+        """Reset buffers and fake the foreground window."""
+        self.buffer.clear_all_buffers()
+        self.buffer._current_window = None
+        self.focused = HWND_A
+        self._fake_focus(self.buffer)
+
+    def _fake_focus(self, buffer):
+        """Route focus checks to self.focused and disable timed cleanup."""
+        buffer._get_foreground_window = lambda: self.focused
+        buffer._focus_check_interval = 0
+        buffer._cleanup_interval = float("inf")
+
+    def _type(self, keys, buffer=None):
+        """Feed keys one at a time into the focused window."""
+        buffer = buffer or self.buffer
+        for key in keys:
+            buffer.on_key_press(key)
+
+    def _prime(self, hwnd, text):
+        """Seed a window's buffer in one call."""
+        self.buffer.set_buffer(text, window_handle=hwnd)
+
+    def test_hwnd_key_type(self):
+        """Buffers are keyed by plain int window handles."""
+
+        class Handle(int):
+            """int subclass standing in for a wrapped HWND."""
+
+        self._type("x")
+        self.buffer.add_text("y", window_handle=Handle(HWND_B))
+
+        self.assertEqual(list(self.buffer._buffers), [HWND_A, HWND_B])
+        for key in self.buffer._buffers:
+            self.assertIs(type(key), int)
+        self.assertEqual(self.buffer.get_buffer(HWND_B), "y")
+
+    def test_get_text_is_memoized(self):
+        """Unchanged buffers return the same cached string object."""
+        self._type("ab")
+        first = self.buffer.get_buffer(HWND_A)
+        second = self.buffer.get_buffer(HWND_A)
+        self.assertIs(first, second)
+
+        self._type("c")
+        third = self.buffer.get_buffer(HWND_A)
+        self.assertIsNot(third, first)
+        self.assertEqual(third, "abc")
+
+    def test_mutations_invalidate_cached_text(self):
+        """Every mutation path drops the cached text for its window."""
+        mutations = (
+            ("backspace", lambda: self.buffer.on_key_press("backspace"), "hell"),
+            ("set", lambda: self.buffer.set_buffer("world", window_handle=HWND_A), "world"),
+            ("clear", lambda: self.buffer.clear_buffer(HWND_A), ""),
+            ("add_text", lambda: self.buffer.add_text("!", window_handle=HWND_A), "hello!"),
+        )
+        for name, mutate, expected in mutations:
+            with self.subTest(mutation=name):
+                self._prime(HWND_A, "hello")
+                cached = self.buffer.get_buffer(HWND_A)
+                self.assertIs(self.buffer.get_buffer(HWND_A), cached)
+
+                mutate()
+
+                self.assertEqual(self.buffer.get_buffer(HWND_A), expected)
+
+    def test_eviction_invalidates_cached_text(self):
+        """Evicted windows lose their cached text as well as their buffer."""
+        self._prime(HWND_B, "old")
+        self._prime(HWND_A, "new")
+        self.assertEqual(self.buffer.get_buffer(HWND_B), "old")
+
+        self.buffer.cleanup_old_buffers(1)
+
+        self.assertNotIn(HWND_B, self.buffer._text_cache)
+        self.assertEqual(self.buffer.get_buffer(HWND_B), "")
+
+    def test_buffers_is_ordered_dict(self):
+        """Buffers and LRU order live in one OrderedDict."""
+        self.assertIsInstance(self.buffer._buffers, OrderedDict)
+
+    def test_lru_eviction_order(self):
+        """Cleanup evicts least recently focused windows first."""
+        for hwnd in (1, 2, 3, 4):
+            self._prime(hwnd, str(hwnd))
+
+        # Focusing window 1 makes it the most recent
+        self.focused = 1
+        self._type("x")
+        self.assertEqual(list(self.buffer._buffers), [2, 3, 4, 1])
+
+        self.buffer.cleanup_old_buffers(2)
+
+        self.assertEqual(list(self.buffer._buffers), [4, 1])
+        self.assertEqual(self.buffer.get_buffer(1), "1x")
+
+    def test_cleanup_keeps_current_window(self):
+        """The focused window survives cleanup even when it is the oldest."""
+        self._type("a")
+        self._prime(HWND_B, "b")
+        self._prime(3, "c")
+
+        self.buffer.cleanup_old_buffers(1)
+
+        self.assertEqual(list(self.buffer._buffers), [HWND_A])
+
+    def test_keystrokes_do_not_refresh_recency(self):
+        """Recency is refreshed on focus change, not on every keystroke."""
+        self._type("a")
+        self._prime(HWND_B, "b")
+        self._type("bc")
+
+        self.assertEqual(list(self.buffer._buffers), [HWND_A, HWND_B])
+
+        self.focused = HWND_B
+        self._type("d")
+        self.focused = HWND_A
+        self._type("e")
+        self.assertEqual(list(self.buffer._buffers), [HWND_B, HWND_A])
+
+    def test_buffer_is_bounded_deque(self):
+        """Each window buffer is a deque capped at max_buffer_size."""
+        self.buffer.add_text("x", window_handle=HWND_A)
+
+        stored = self.buffer._buffers[HWND_A]
+        self.assertIsInstance(stored, deque)
+        self.assertEqual(stored.maxlen, self.buffer.max_buffer_size)
+        self.assertEqual(stored.maxlen, 100)
+
+    def test_changing_max_buffer_size_rebounds_buffers(self):
+        """Shrinking max_buffer_size trims existing buffers; growing keeps text."""
+        buffer = KeystrokeBuffer(max_buffer_size=10)
+        buffer.set_buffer("abcdefghij", window_handle=HWND_A)
+        buffer.set_buffer("xyz", window_handle=HWND_B)
+        self.assertEqual(buffer.get_buffer(HWND_A), "abcdefghij")
+
+        buffer.max_buffer_size = 4
+
+        self.assertEqual(buffer.get_buffer(HWND_A), "ghij")
+        self.assertEqual(buffer.get_buffer(HWND_B), "xyz")
+        self.assertEqual(list(buffer._buffers), [HWND_A, HWND_B])
+        for stored in buffer._buffers.values():
+            self.assertEqual(stored.maxlen, 4)
+
+        buffer.add_text("12", window_handle=HWND_B)
+        self.assertEqual(buffer.get_buffer(HWND_B), "yz12")
+
+        buffer.max_buffer_size = 8
+        buffer.add_text("kl", window_handle=HWND_A)
+        self.assertEqual(buffer.get_buffer(HWND_A), "ghijkl")
+        self.assertEqual(buffer._buffers[HWND_A].maxlen, 8)
+
+    @unittest.skipUnless(os.getenv("RUN_PERF"), "set RUN_PERF=1 to run timing tests")
+    def test_lru_eviction_scales(self):
+        """Evicting one window per insert stays O(1) amortized."""
+        buffer = KeystrokeBuffer(max_buffer_size=8)
+        start = perf_counter_ns()
+        for hwnd in range(10_000):
+            buffer.add_text("a", window_handle=hwnd)
+            buffer.cleanup_old_buffers(1024)
+        elapsed = perf_counter_ns() - start
+
+        self.assertEqual(len(buffer._buffers), 1024)
+        self.assertLess(elapsed, 500_000_000)
+
+    @unittest.skipUnless(os.getenv("RUN_PERF"), "set RUN_PERF=1 to run timing tests")
+    def test_backspace_is_constant_time(self):
+        """Backspacing a full buffer to empty costs O(1) per key."""
+        buffer = KeystrokeBuffer(max_buffer_size=10_000)
+        self._fake_focus(buffer)
+        buffer.set_buffer("x" * 10_000, window_handle=HWND_A)
+
+        start = perf_counter_ns()
+        for _ in range(10_000):
+            buffer.on_key_press("backspace")
+        elapsed = perf_counter_ns() - start
+
+        self.assertEqual(buffer.get_buffer(HWND_A), "")
+        self.assertLess(elapsed, 200_000_000)
+
+
+if __name__ == "__main__":
+    unittest.main()